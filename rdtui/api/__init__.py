@@ -1,7 +1,16 @@
 """API clients for Real-Debrid and aria2."""
 
 from rdtui.api.aria2 import Aria2RPC
+from rdtui.api.cache import UnrestrictCache, token_scoped_path
+from rdtui.api.ratelimit import TokenBucket
 from rdtui.api.real_debrid import RDClient
+from rdtui.api.retry import RetryPolicy
 
-__all__ = ["Aria2RPC", "RDClient"]
-
+__all__ = [
+    "Aria2RPC",
+    "RDClient",
+    "RetryPolicy",
+    "TokenBucket",
+    "UnrestrictCache",
+    "token_scoped_path",
+]
@@ -1,24 +1,193 @@
 """aria2 RPC client."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 
+from rdtui.api.retry import RetryPolicy, with_retry
+
+# WebSocket transport is optional – without it we stay on HTTP POST
+try:
+    import websockets  # type: ignore
+except Exception:
+    websockets = None  # type: ignore
+
+# Methods that create downloads; repeating them after an ambiguous failure
+# would enqueue the same file twice
+NON_IDEMPOTENT_METHODS = {"aria2.addUri", "aria2.addTorrent", "aria2.addMetalink"}
+
+# Fields requested for queue listings
+LIST_KEYS = [
+    "gid",
+    "status",
+    "totalLength",
+    "completedLength",
+    "downloadSpeed",
+    "files",
+]
+STOPPED_KEYS = LIST_KEYS + ["errorMessage"]
+
+# Pause (s) before the first WebSocket reconnect attempt, doubled up to the max
+WS_RECONNECT_MIN = 1.0
+WS_RECONNECT_MAX = 60.0
+
+
+def _parse_stat(stat: Dict[str, Any]) -> Dict[str, int]:
+    """Convert aria2.getGlobalStat values (decimal strings) to integers."""
+    out: Dict[str, int] = {}
+    for key, value in (stat or {}).items():
+        try:
+            out[key] = int(value)
+        except (TypeError, ValueError):
+            continue
+    return out
+
+
+# Listener for aria2 notifications: (event name, e.g. "onDownloadComplete", gid)
+Aria2Listener = Callable[[str, str], Any]
+
 
 class Aria2RPC:
-    """Client for interacting with aria2 via JSON-RPC."""
+    """Client for interacting with aria2 via JSON-RPC.
+
+    Calls go over HTTP POST unless connect_ws() succeeded; then they share a
+    single persistent WebSocket which also delivers aria2 notifications. A
+    dropped WebSocket is reconnected in the background with backoff, so
+    notifications resume without anyone polling.
+    """
 
-    def __init__(self, url: str, secret: str | None = None):
+    def __init__(
+        self,
+        url: str,
+        secret: str | None = None,
+        retry: Optional[RetryPolicy] = None,
+        timeout: float = 15.0,
+        limits: Optional[httpx.Limits] = None,
+    ):
         """Initialize the aria2 RPC client.
 
         Args:
             url: aria2 RPC URL (e.g., http://127.0.0.1:6800/jsonrpc)
             secret: Optional RPC secret token
+            retry: Retry policy for transient failures
+            timeout: Default per-call timeout in seconds
+            limits: Connection pool limits
         """
         self.url = url
         self.secret = secret or ""
+        self.retry = retry or RetryPolicy()
+        self.timeout = timeout
         self._id = 0
-        self._client = httpx.AsyncClient(timeout=15.0)
+        self._client = httpx.AsyncClient(timeout=timeout, limits=limits or httpx.Limits())
+        # WebSocket transport state
+        self._ws: Any = None
+        self._ws_reader: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._listeners: List[Aria2Listener] = []
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def ws_url(self) -> str:
+        """Get the WebSocket URL matching the HTTP RPC URL."""
+        if self.url.startswith("http"):
+            return "ws" + self.url[len("http"):]
+        return self.url
+
+    @property
+    def ws_connected(self) -> bool:
+        """Check whether calls currently go over the WebSocket."""
+        return self._ws is not None
+
+    def add_listener(self, listener: Aria2Listener) -> None:
+        """Subscribe to aria2 notifications (WebSocket transport only).
+
+        Args:
+            listener: Called with the event name and the download GID
+        """
+        self._listeners.append(listener)
+
+    async def connect_ws(self) -> bool:
+        """Open the persistent WebSocket connection.
+
+        Returns:
+            True if connected; False if unavailable (calls keep using HTTP)
+        """
+        if self._ws is not None:
+            return True
+        if websockets is None:
+            return False
+        try:
+            ws = await websockets.connect(self.ws_url, max_size=None)
+        except Exception:
+            return False
+        self._ws = ws
+        self._ws_reader = asyncio.create_task(self._read_ws(ws))
+        return True
+
+    async def _read_ws(self, ws: Any) -> None:
+        """Dispatch WebSocket messages to pending calls and listeners."""
+        try:
+            async for raw in ws:
+                try:
+                    msg = json.loads(raw)
+                except ValueError:
+                    continue
+                fut = self._pending.get(msg.get("id"))
+                if fut is not None:
+                    if not fut.done():
+                        fut.set_result(msg)
+                    continue
+                method = msg.get("method") or ""
+                if not method.startswith("aria2.on"):
+                    continue
+                event = method[len("aria2."):]
+                for item in msg.get("params") or []:
+                    gid = item.get("gid") if isinstance(item, dict) else None
+                    if not gid:
+                        continue
+                    for listener in list(self._listeners):
+                        try:
+                            listener(event, gid)
+                        except Exception:
+                            pass
+        except Exception:
+            pass
+        finally:
+            if self._ws is ws:
+                self._ws = None
+            for fut in self._pending.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError("aria2 WebSocket closed"))
+            if not self._closed:
+                self._schedule_reconnect()
+
+    def _schedule_reconnect(self) -> None:
+        """Reconnect the WebSocket in the background (no-op if already trying)."""
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            return
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """Retry connect_ws with exponential backoff until it succeeds or the client closes."""
+        delay = WS_RECONNECT_MIN
+        while not self._closed:
+            await asyncio.sleep(delay)
+            if self._closed or await self.connect_ws():
+                return
+            delay = min(WS_RECONNECT_MAX, delay * 2)
+
+    async def _ws_call(self, payload: Dict[str, Any], timeout: Optional[float]) -> Any:
+        """Send a call over the WebSocket and wait for its response."""
+        fut = asyncio.get_running_loop().create_future()
+        self._pending[payload["id"]] = fut
+        try:
+            await self._ws.send(json.dumps(payload))
+            return await asyncio.wait_for(fut, timeout or self.timeout)
+        finally:
+            self._pending.pop(payload["id"], None)
 
     def _next_id(self) -> int:
         """Get the next RPC call ID."""
@@ -29,12 +198,26 @@ class Aria2RPC:
         """Get the authentication token for RPC calls."""
         return [f"token:{self.secret}"] if self.secret else []
 
-    async def _call(self, method: str, params: List[Any] | None = None) -> Any:
+    async def _call(
+        self,
+        method: str,
+        params: List[Any] | None = None,
+        *,
+        idempotent: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        auth: bool = True,
+        retry: bool = True,
+    ) -> Any:
         """Make an RPC call to aria2.
 
         Args:
             method: RPC method name
             params: Method parameters
+            idempotent: Whether the call may be retried; defaults by method
+            timeout: Per-call timeout overriding the client default
+            auth: Prepend the secret token (system.* methods take none)
+            retry: Apply the retry policy; False fails on the first error
+                (availability checks and polls that are repeated anyway)
 
         Returns:
             RPC result
@@ -46,10 +229,41 @@ class Aria2RPC:
             "jsonrpc": "2.0",
             "id": self._next_id(),
             "method": method,
-            "params": (self._auth_token() + (params or [])),
+            "params": ((self._auth_token() if auth else []) + (params or [])),
         }
-        r = await self._client.post(self.url, json=payload)
-        r.raise_for_status()
+        if idempotent is None:
+            idempotent = method not in NON_IDEMPOTENT_METHODS
+
+        if self._ws is not None:
+            try:
+                data = await self._ws_call(payload, timeout)
+            except asyncio.TimeoutError:
+                # Only this call timed out; the connection stays usable
+                raise
+            except Exception:
+                # Connection lost: drop it (the reader reconnects in the
+                # background) and, if allowed, repeat over HTTP
+                await self._close_ws()
+                if not idempotent or not retry:
+                    raise
+            else:
+                if "error" in data:
+                    raise RuntimeError(data["error"])
+                return data.get("result")
+
+        kwargs: Dict[str, Any] = {"json": payload}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        async def post() -> httpx.Response:
+            r = await self._client.post(self.url, **kwargs)
+            r.raise_for_status()
+            return r
+
+        if retry:
+            r = await with_retry(post, self.retry, idempotent)
+        else:
+            r = await post()
         data = r.json()
         if "error" in data:
             raise RuntimeError(data["error"])
@@ -68,13 +282,42 @@ class Aria2RPC:
         Returns:
             GID (download identifier)
         """
+        gid = await self._call("aria2.addUri", [uris, self._uri_options(out, dir)])
+        return gid
+
+    async def add_uris(
+        self,
+        items: List[Tuple[List[str], Optional[str]]],
+        dir: Optional[str] = None,
+    ) -> List[Any]:
+        """Add many downloads in a single round trip (system.multicall).
+
+        Args:
+            items: List of (URIs, output filename) tuples
+            dir: Download directory shared by all items
+
+        Returns:
+            One entry per item, in order: its GID, or a RuntimeError if aria2
+            rejected that item
+        """
+        if not items:
+            return []
+        return await self.multicall(
+            [
+                ("aria2.addUri", [uris, self._uri_options(out, dir)])
+                for uris, out in items
+            ]
+        )
+
+    @staticmethod
+    def _uri_options(out: Optional[str], dir: Optional[str]) -> Dict[str, Any]:
+        """Build addUri options."""
         options: Dict[str, Any] = {}
         if out:
             options["out"] = out
         if dir:
             options["dir"] = dir
-        gid = await self._call("aria2.addUri", [uris, options])
-        return gid
+        return options
 
     async def tell_status(self, gid: str) -> Dict[str, Any]:
         """Get status of a download.
@@ -95,17 +338,13 @@ class Aria2RPC:
         ]
         return await self._call("aria2.tellStatus", [gid, keys])
 
-    async def tell_active(self) -> List[Dict[str, Any]]:
-        """Get list of active downloads."""
-        keys = [
-            "gid",
-            "status",
-            "totalLength",
-            "completedLength",
-            "downloadSpeed",
-            "files",
-        ]
-        return await self._call("aria2.tellActive", [keys])
+    async def tell_active(self, retry: bool = True) -> List[Dict[str, Any]]:
+        """Get list of active downloads.
+
+        Args:
+            retry: Apply the retry policy; False fails on the first error
+        """
+        return await self._call("aria2.tellActive", [LIST_KEYS], retry=retry)
 
     async def tell_waiting(
         self, offset: int = 0, num: int = 100
@@ -116,15 +355,7 @@ class Aria2RPC:
             offset: Offset in the list
             num: Number of items to retrieve
         """
-        keys = [
-            "gid",
-            "status",
-            "totalLength",
-            "completedLength",
-            "downloadSpeed",
-            "files",
-        ]
-        return await self._call("aria2.tellWaiting", [offset, num, keys])
+        return await self._call("aria2.tellWaiting", [offset, num, LIST_KEYS])
 
     async def tell_stopped(
         self, offset: int = 0, num: int = 100
@@ -135,16 +366,106 @@ class Aria2RPC:
             offset: Offset in the list
             num: Number of items to retrieve
         """
-        keys = [
-            "gid",
-            "status",
-            "totalLength",
-            "completedLength",
-            "downloadSpeed",
-            "files",
-            "errorMessage",
+        return await self._call("aria2.tellStopped", [offset, num, STOPPED_KEYS])
+
+    async def multicall(
+        self, calls: List[Tuple[str, List[Any]]], retry: bool = True
+    ) -> List[Any]:
+        """Run several RPC methods in a single round trip (system.multicall).
+
+        Args:
+            calls: List of (method name, params) tuples; the token is added here
+            retry: Apply the retry policy; False fails on the first error
+
+        Returns:
+            One entry per call, in order: the method result, or a RuntimeError
+            carrying the fault if that particular call failed
+        """
+        methods = [
+            {"methodName": method, "params": self._auth_token() + (params or [])}
+            for method, params in calls
         ]
-        return await self._call("aria2.tellStopped", [offset, num, keys])
+        idempotent = not any(method in NON_IDEMPOTENT_METHODS for method, _ in calls)
+        results = await self._call(
+            "system.multicall", [methods], idempotent=idempotent, auth=False, retry=retry
+        )
+        out: List[Any] = []
+        for res in results or []:
+            # Success is wrapped in a one-element list, failure is a fault struct
+            if isinstance(res, list) and res:
+                out.append(res[0])
+            elif isinstance(res, dict):
+                out.append(RuntimeError(res))
+            else:
+                out.append(res)
+        return out
+
+    async def global_stat(self) -> Dict[str, int]:
+        """Get queue totals and overall speed.
+
+        Returns:
+            Dict with numActive, numWaiting, numStopped, downloadSpeed, ...
+        """
+        stat = await self._call("aria2.getGlobalStat", [])
+        return _parse_stat(stat)
+
+    async def tell_window(
+        self,
+        offset: int,
+        num: int,
+        counts: Optional[Dict[str, int]] = None,
+        retry: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Get a window of the queue in aria2 order (active, waiting, stopped).
+
+        The window is split between the three lists using ``counts`` from
+        the previous call; fresh totals come back in the same round trip,
+        so a shifted queue is corrected on the next call.
+
+        Args:
+            offset: Position of the first item in the whole queue
+            num: Maximum number of items to retrieve
+            counts: Totals returned by the previous call, if any
+            retry: Apply the retry policy; False fails on the first error
+
+        Returns:
+            Tuple of (items, counts) with at most ``num`` items
+
+        Raises:
+            RuntimeError: If any of the listings failed
+        """
+        counts = counts or {}
+        n_active = counts.get("numActive", 0)
+        n_waiting = counts.get("numWaiting", 0)
+        end = offset + num
+        w_start = max(0, offset - n_active)
+        w_num = max(0, end - n_active) - w_start
+        if "numWaiting" in counts:
+            # Known total: don't ask for waiting items past the end of the list
+            w_num = min(w_num, max(0, n_waiting - w_start))
+        s_start = max(0, offset - n_active - n_waiting)
+        s_num = max(0, end - n_active - n_waiting) - s_start
+
+        # Active downloads are few (max-concurrent-downloads) and change
+        # the fastest, so they are always fetched
+        calls: List[Tuple[str, List[Any]]] = [
+            ("aria2.getGlobalStat", []),
+            ("aria2.tellActive", [LIST_KEYS]),
+        ]
+        if w_num > 0:
+            calls.append(("aria2.tellWaiting", [w_start, w_num, LIST_KEYS]))
+        if s_num > 0:
+            calls.append(("aria2.tellStopped", [s_start, s_num, STOPPED_KEYS]))
+        results = await self.multicall(calls, retry=retry)
+        for res in results:
+            if isinstance(res, Exception):
+                raise res
+
+        stat, active, *rest = results
+        waiting = rest.pop(0) if w_num > 0 else []
+        stopped = rest.pop(0) if s_num > 0 else []
+        items = active[offset:end] + waiting + stopped
+        return items[:num], _parse_stat(stat)
 
     async def pause(self, gid: str) -> Any:
         """Pause a download.
@@ -169,7 +490,24 @@ class Aria2RPC:
             except Exception:
                 raise
 
+    async def _close_ws(self) -> None:
+        """Close the WebSocket connection, if any."""
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+        if self._ws_reader is not None:
+            self._ws_reader.cancel()
+            self._ws_reader = None
+
     async def close(self):
-        """Close the HTTP client."""
+        """Close the WebSocket and HTTP clients."""
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        await self._close_ws()
         await self._client.aclose()
 
@@ -0,0 +1,139 @@
+"""On-disk cache for Real-Debrid unrestrict results."""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Fields of the /unrestrict/link response worth keeping
+CACHED_FIELDS = ("download", "filename", "filesize", "link")
+
+
+def token_scoped_path(directory: Path, token: str, stem: str = "unrestrict_cache") -> Path:
+    """Get the cache file of an API token.
+
+    Links unrestricted for one account must not be served to another, so
+    each token gets its own file (named by a hash, never the token itself).
+
+    Args:
+        directory: Directory holding the cache files
+        token: RD API token
+        stem: File name prefix
+    """
+    digest = hashlib.sha256(token.encode()).hexdigest()[:16]
+    return directory / f"{stem}_{digest}.json"
+
+
+class UnrestrictCache:
+    """LRU cache of unrestricted links with per-entry expiry, persisted as JSON."""
+
+    def __init__(self, path: Path, ttl: float = 4 * 3600, max_entries: int = 2000):
+        """Initialize the cache and load existing entries from disk.
+
+        Args:
+            path: JSON file backing the cache
+            ttl: Seconds an entry stays valid (should not exceed RD link validity)
+            max_entries: Maximum number of entries; least recently used are evicted
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._dirty = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._load()
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._entries)
+
+    def _load(self) -> None:
+        """Load entries from disk, dropping expired ones."""
+        try:
+            raw = json.loads(self.path.read_text())
+        except Exception:
+            return
+        if not isinstance(raw, dict):
+            # Valid JSON but not ours (e.g. [] or null): start empty
+            return
+        now = time.time()
+        for link, entry in raw.items():
+            if isinstance(entry, dict) and entry.get("expires", 0) > now:
+                self._entries[link] = entry
+
+    def get(self, link: str) -> Optional[Dict[str, Any]]:
+        """Get a cached unrestrict result.
+
+        Args:
+            link: Source link that was unrestricted
+
+        Returns:
+            Dict with the cached response fields, or None if missing/expired
+        """
+        entry = self._entries.get(link)
+        if entry is None:
+            return None
+        if entry.get("expires", 0) <= time.time():
+            del self._entries[link]
+            self._mark_dirty()
+            return None
+        self._entries.move_to_end(link)
+        return {k: entry[k] for k in CACHED_FIELDS if k in entry}
+
+    def put(self, link: str, result: Dict[str, Any]) -> None:
+        """Store an unrestrict result.
+
+        Args:
+            link: Source link that was unrestricted
+            result: Response of /unrestrict/link
+        """
+        if not result.get("download"):
+            return
+        entry: Dict[str, Any] = {k: result[k] for k in CACHED_FIELDS if k in result}
+        entry["expires"] = time.time() + self.ttl
+        self._entries[link] = entry
+        self._entries.move_to_end(link)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._mark_dirty()
+
+    def invalidate(self, link: str) -> None:
+        """Drop a single entry.
+
+        Args:
+            link: Source link to forget
+        """
+        if self._entries.pop(link, None) is not None:
+            self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """Schedule a write; bursts of changes are coalesced into one."""
+        self._dirty = True
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(1.0, self.flush)
+
+    def flush(self) -> None:
+        """Write pending changes to disk."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._entries))
+            os.replace(tmp, self.path)
+        except Exception:
+            # Cache is best-effort; never break the app because of it
+            pass
@@ -0,0 +1,109 @@
+"""Client-side rate limiting for API clients."""
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import httpx
+
+
+class TokenBucket:
+    """Token bucket shared by all requests of a client.
+
+    Requests wait in FIFO order for a token instead of failing; a 429
+    response blocks the whole bucket until the server's Retry-After passes.
+    """
+
+    def __init__(self, rate_per_minute: float = 250, burst: int = 25):
+        """Initialize the bucket.
+
+        Args:
+            rate_per_minute: Sustained number of requests allowed per minute
+            burst: Maximum number of requests that may be sent back to back
+        """
+        self.rate = max(rate_per_minute, 1) / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self.waiting = 0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accumulated since the last update."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> int:
+        """Get the number of requests that can be sent right now."""
+        now = time.monotonic()
+        if now < self._blocked_until:
+            return 0
+        self._refill(now)
+        return int(self._tokens)
+
+    @property
+    def blocked_for(self) -> float:
+        """Get the remaining Retry-After pause in seconds."""
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent and consume a token."""
+        self.waiting += 1
+        try:
+            # asyncio.Lock wakes waiters in FIFO order
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if now < self._blocked_until:
+                        await asyncio.sleep(self._blocked_until - now)
+                        continue
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+    def penalize(self, retry_after: float) -> None:
+        """Block the bucket after the server rejected a request with 429.
+
+        Args:
+            retry_after: Seconds to wait before sending anything again
+        """
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + max(0.0, retry_after))
+        self._tokens = 0.0
+        self._updated = now
+
+    def status(self) -> Dict[str, Any]:
+        """Get the current budget for display."""
+        return {
+            "tokens": self.tokens,
+            "capacity": self.capacity,
+            "waiting": self.waiting,
+            "blocked_for": self.blocked_for,
+        }
+
+
+def retry_after_seconds(response: httpx.Response, default: float = 5.0) -> float:
+    """Parse the Retry-After header (seconds or HTTP date).
+
+    Args:
+        response: The 429/503 response
+        default: Value used when the header is missing or malformed
+    """
+    value: Optional[str] = response.headers.get("Retry-After")
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except Exception:
+        return default
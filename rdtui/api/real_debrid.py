@@ -1,50 +1,190 @@
 """Real-Debrid API client."""
 
-from typing import Any, Dict, List
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 
+from rdtui.api.cache import UnrestrictCache
+from rdtui.api.ratelimit import TokenBucket, retry_after_seconds
+from rdtui.api.retry import RetryPolicy, with_retry
+
+# HTTP/2 uses the "h2" package from httpx[http2]; without it RD falls back to HTTP/1.1
+try:
+    import h2  # type: ignore  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 API_BASE = "https://api.real-debrid.com/rest/1.0"
 
+# Torrent states whose files and links no longer change
+FINISHED_STATUSES = {"downloaded"}
+
+# How many 429 responses a single request may absorb before giving up
+MAX_RATE_LIMITED_ATTEMPTS = 8
+
+# HTTP methods that are safe to repeat after an ambiguous failure
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE"}
+
 
 class RDClient:
     """Client for interacting with the Real-Debrid API."""
 
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        link_cache: Optional[UnrestrictCache] = None,
+        info_ttl: float = 10.0,
+        limiter: Optional[TokenBucket] = None,
+        retry: Optional[RetryPolicy] = None,
+        timeout: float = 30.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+    ):
         """Initialize the Real-Debrid client.
 
         Args:
             token: Real-Debrid API token
+            link_cache: Optional cache for unrestrict_link results
+            info_ttl: Seconds torrent_info of an unfinished torrent is reused
+            limiter: Request budget shared by all calls (RD allows 250/min)
+            retry: Retry policy for transient failures
+            timeout: Default per-request timeout in seconds
+            limits: Connection pool limits for the RD client
+            http2: Use HTTP/2 for RD if the h2 package is installed
         """
         self.token = token
+        self.link_cache = link_cache
+        self.limiter = limiter or TokenBucket()
+        self.retry = retry or RetryPolicy()
+        self.info_ttl = info_ttl
+        # tid -> (monotonic expiry or None for "forever", torrent info)
+        self._info_cache: Dict[str, Tuple[Optional[float], Dict[str, Any]]] = {}
+        self.http2 = http2 and HTTP2_AVAILABLE
         self._client = httpx.AsyncClient(
             base_url=API_BASE,
             headers={"Authorization": f"Bearer {token}"},
-            timeout=30.0,
+            timeout=timeout,
+            limits=limits or httpx.Limits(),
+            http2=self.http2,
+        )
+        # Third-party .torrent downloads get their own pool and never see the token
+        self._fetch_client = httpx.AsyncClient(
+            timeout=timeout, limits=httpx.Limits(max_connections=4)
         )
 
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client and persist the link cache."""
+        if self.link_cache is not None:
+            self.link_cache.flush()
         await self._client.aclose()
+        await self._fetch_client.aclose()
 
-    async def _get(self, path: str, **kwargs):
-        """Make a GET request to the API."""
-        r = await self._client.get(path, **kwargs)
+    async def warmup(self, connections: int = 1) -> None:
+        """Open pooled connections ahead of time so later calls skip the TLS handshake.
+
+        With HTTP/2 a single connection is multiplexed, so one is enough.
+
+        Args:
+            connections: Number of connections to open over HTTP/1.1
+        """
+        n = 1 if self.http2 else max(1, connections)
+        await asyncio.gather(
+            *(self._request("GET", "/time") for _ in range(n)),
+            return_exceptions=True,
+        )
+
+    def rate_status(self) -> Dict[str, Any]:
+        """Get the remaining request budget and the number of queued requests."""
+        return self.limiter.status()
+
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a single attempt once the rate limiter allows it.
+
+        429 responses are not surfaced: the limiter is paused for the
+        Retry-After period and the request is queued again.
+        """
+        for _ in range(MAX_RATE_LIMITED_ATTEMPTS - 1):
+            await self.limiter.acquire()
+            r = await self._client.request(method, path, **kwargs)
+            if r.status_code != 429:
+                break
+            self.limiter.penalize(retry_after_seconds(r))
+        else:
+            await self.limiter.acquire()
+            r = await self._client.request(method, path, **kwargs)
+        if r.status_code in self.retry.retry_statuses:
+            r.raise_for_status()
+        return r
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        idempotent: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a rate-limited request, retrying transient failures.
+
+        Args:
+            method: HTTP method
+            path: API path
+            idempotent: Whether the call may be repeated; defaults by method
+            timeout: Per-call timeout overriding the client default
+        """
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return await with_retry(
+            lambda: self._send(method, path, **kwargs), self.retry, idempotent
+        )
+
+    async def _get_response(
+        self, path: str, timeout: Optional[float] = None, **kwargs
+    ) -> httpx.Response:
+        """Make a GET request to the API and return the raw response."""
+        r = await self._request("GET", path, timeout=timeout, **kwargs)
         r.raise_for_status()
+        return r
+
+    async def _get(self, path: str, timeout: Optional[float] = None, **kwargs):
+        """Make a GET request to the API."""
+        r = await self._get_response(path, timeout=timeout, **kwargs)
         return r.json()
 
-    async def _post(self, path: str, data: Dict[str, Any] | None = None):
-        """Make a POST request to the API."""
-        r = await self._client.post(path, data=data)
+    async def _post(
+        self,
+        path: str,
+        data: Dict[str, Any] | None = None,
+        idempotent: bool = False,
+        timeout: Optional[float] = None,
+    ):
+        """Make a POST request to the API.
+
+        Args:
+            path: API path
+            data: Form data
+            idempotent: Whether the call may be retried after an ambiguous failure
+            timeout: Per-call timeout overriding the client default
+        """
+        r = await self._request(
+            "POST", path, data=data, idempotent=idempotent, timeout=timeout
+        )
         r.raise_for_status()
         try:
             return r.json()
         except Exception:
             return {}
 
-    async def _delete(self, path: str):
+    async def _delete(self, path: str, timeout: Optional[float] = None):
         """Make a DELETE request to the API."""
-        r = await self._client.delete(path)
+        r = await self._request("DELETE", path, timeout=timeout)
         # RD returns 204 No Content on success for delete endpoints
         if r.status_code not in (200, 204):
             r.raise_for_status()
@@ -59,17 +199,123 @@ class RDClient:
         """Get user information."""
         return await self._get("/user")
 
-    async def torrents(self) -> List[Dict[str, Any]]:
-        """Get list of user's torrents."""
-        return await self._get("/torrents")
+    async def torrents(
+        self, page_size: int = 1000, concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Get the full list of user's torrents.
+
+        Args:
+            page_size: Number of torrents requested per page
+            concurrency: Maximum number of pages fetched at once
+        """
+        out: List[Dict[str, Any]] = []
+        async for page in self.iter_torrent_pages(
+            page_size=page_size, concurrency=concurrency
+        ):
+            out.extend(page)
+        return out
+
+    async def torrents_page(
+        self, offset: int = 0, limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Get a single page of user's torrents (newest first).
+
+        Args:
+            offset: Index of the first torrent to return
+            limit: Maximum number of torrents to return
+
+        Returns:
+            Tuple of (torrents, total count from X-Total-Count or None)
+        """
+        r = await self._get_response(
+            "/torrents", params={"offset": offset, "limit": limit}
+        )
+        total = r.headers.get("X-Total-Count")
+        # RD answers 204 No Content when the requested range is empty
+        items = r.json() if r.status_code != 204 and r.content else []
+        return items, (int(total) if total and total.isdigit() else None)
+
+    async def iter_torrent_pages(
+        self, first_page_size: int = 100, page_size: int = 1000, concurrency: int = 4
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of user's torrents as soon as they arrive.
+
+        The first (small) page is fetched alone to learn the total count from
+        the X-Total-Count header; the remaining pages are then fetched
+        concurrently and yielded in completion order, not offset order.
+
+        Args:
+            first_page_size: Number of torrents in the first request
+            page_size: Number of torrents per subsequent request
+            concurrency: Maximum number of pages fetched at once
+        """
+        first_page_size = max(1, first_page_size)
+        page_size = max(1, page_size)
+        items, total = await self.torrents_page(0, first_page_size)
+        yield items
+        if len(items) < first_page_size:
+            return
+
+        if total is None:
+            # No count header – walk the list sequentially until a short page
+            offset = len(items)
+            while True:
+                items, _ = await self.torrents_page(offset, page_size)
+                if items:
+                    yield items
+                if len(items) < page_size:
+                    return
+                offset += len(items)
+
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(offset: int) -> List[Dict[str, Any]]:
+            async with sem:
+                page, _ = await self.torrents_page(offset, page_size)
+                return page
+
+        tasks = [
+            asyncio.create_task(fetch(offset))
+            for offset in range(first_page_size, total, page_size)
+        ]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                page = await fut
+                if page:
+                    yield page
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def torrent_info(self, tid: str) -> Dict[str, Any]:
         """Get detailed information about a torrent.
 
+        Finished torrents are memoized until invalidated; others are reused
+        for ``info_ttl`` seconds.
+
         Args:
             tid: Torrent ID
         """
-        return await self._get(f"/torrents/info/{tid}")
+        hit = self._info_cache.get(tid)
+        if hit is not None:
+            expires, info = hit
+            if expires is None or expires > time.monotonic():
+                return info
+        info = await self._get(f"/torrents/info/{tid}")
+        if info.get("status") in FINISHED_STATUSES:
+            self._info_cache[tid] = (None, info)
+        else:
+            self._info_cache[tid] = (time.monotonic() + self.info_ttl, info)
+        return info
+
+    def invalidate_torrent_info(self, *tids: str) -> None:
+        """Forget memoized torrent_info results.
+
+        Args:
+            tids: Torrent IDs to forget
+        """
+        for tid in tids:
+            self._info_cache.pop(tid, None)
 
     async def add_magnet(self, magnet: str) -> Dict[str, Any]:
         """Add a magnet link.
@@ -85,7 +331,9 @@ class RDClient:
         Args:
             tid: Torrent ID
         """
-        return await self._post(f"/torrents/selectFiles/{tid}", data={"files": "all"})
+        return await self._post(
+            f"/torrents/selectFiles/{tid}", data={"files": "all"}, idempotent=True
+        )
 
     async def delete_torrent(self, tid: str) -> Dict[str, Any]:
         """Delete a torrent.
@@ -93,6 +341,7 @@ class RDClient:
         Args:
             tid: Torrent ID
         """
+        self.invalidate_torrent_info(tid)
         return await self._delete(f"/torrents/delete/{tid}")
 
     async def unrestrict_link(self, link: str) -> Dict[str, Any]:
@@ -101,7 +350,16 @@ class RDClient:
         Args:
             link: URL to unrestrict
         """
-        return await self._post("/unrestrict/link", data={"link": link})
+        if self.link_cache is not None:
+            cached = self.link_cache.get(link)
+            if cached is not None:
+                return cached
+        result = await self._post(
+            "/unrestrict/link", data={"link": link}, idempotent=True
+        )
+        if self.link_cache is not None:
+            self.link_cache.put(link, result)
+        return result
 
     async def add_torrent_bytes(
         self, data: bytes, filename: str = "upload.torrent"
@@ -113,7 +371,8 @@ class RDClient:
             filename: Filename for the upload
         """
         files = {"file": (filename, data, "application/x-bittorrent")}
-        r = await self._client.post("/torrents/addTorrent", files=files)
+        # Not idempotent: retried only if the upload never reached RD
+        r = await self._request("POST", "/torrents/addTorrent", files=files)
         r.raise_for_status()
         try:
             return r.json()
@@ -126,7 +385,7 @@ class RDClient:
         Args:
             url: URL to .torrent file
         """
-        resp = await self._client.get(url)
+        resp = await self._fetch_client.get(url)
         resp.raise_for_status()
         fname = url.split("/")[-1] or "upload.torrent"
         return await self.add_torrent_bytes(resp.content, fname)
@@ -0,0 +1,74 @@
+"""Retry policy for transient API failures."""
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, FrozenSet, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# Failures where the request provably never reached the server
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with jitter for timeouts, resets and 5xx responses."""
+
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    jitter: float = 0.5
+    retry_statuses: FrozenSet[int] = field(
+        default_factory=lambda: frozenset({500, 502, 503, 504})
+    )
+
+    def delay(self, attempt: int) -> float:
+        """Get the pause before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+        """
+        base = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return base * (1 - self.jitter * random.random())
+
+    def should_retry(self, exc: BaseException, idempotent: bool) -> bool:
+        """Decide whether a failed call may be sent again.
+
+        Non-idempotent calls are retried only when the request never left
+        the client, so e.g. a magnet is never added twice.
+
+        Args:
+            exc: Exception raised by the call
+            idempotent: Whether repeating the call is harmless
+        """
+        if isinstance(exc, _NOT_SENT_ERRORS):
+            return True
+        if not idempotent:
+            return False
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code in self.retry_statuses
+        return isinstance(exc, httpx.TransportError)
+
+
+async def with_retry(
+    call: Callable[[], Awaitable[T]], policy: RetryPolicy, idempotent: bool
+) -> T:
+    """Run ``call`` and retry it according to ``policy``.
+
+    Args:
+        call: Zero-argument coroutine factory performing one attempt
+        policy: Retry policy
+        idempotent: Whether repeating the call is harmless
+    """
+    attempt = 1
+    while True:
+        try:
+            return await call()
+        except Exception as e:
+            if attempt >= policy.max_attempts or not policy.should_retry(e, idempotent):
+                raise
+            await asyncio.sleep(policy.delay(attempt))
+            attempt += 1
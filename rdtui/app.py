@@ -2,11 +2,13 @@
 
 import asyncio
 import os
-import re
 import sys
-from datetime import datetime
+import threading
+import time
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import httpx
 from rich.text import Text
@@ -15,30 +17,71 @@ from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
-from textual.widgets import Footer, Header, Input, Log, Tabs
-
-from rdtui.api import Aria2RPC, RDClient
-from rdtui.config import DEFAULT_CONFIG, load_config, save_config
-from rdtui.models import TorrentRow
+from textual.timer import Timer
+from textual.widgets import DataTable, Footer, Header, Input, Log, Tab, Tabs
+from textual.worker import get_current_worker
+
+from rdtui.api import (
+    Aria2RPC,
+    RDClient,
+    RetryPolicy,
+    TokenBucket,
+    UnrestrictCache,
+    token_scoped_path,
+)
+from rdtui.config import DEFAULT_CONFIG, get_config_dir, load_config, save_config
+from rdtui.models import (
+    CATEGORY_ALL,
+    CATEGORY_GAMES,
+    CATEGORY_MOVIES,
+    CATEGORY_SERIES,
+    SETTLED_STATUSES,
+    LibraryDelta,
+    TorrentLibrary,
+    TorrentRow,
+)
 from rdtui.ui import (
     CommandPaletteModal,
     HelpModal,
     InputModal,
+    QueuePoller,
     QueueTable,
     QuickPasteModal,
     SettingsModal,
     TorrentsTable,
 )
 from rdtui.utils import (
+    LazyRanking,
+    SearchIndex,
+    SearchSession,
     format_eta,
     format_progress,
     format_size,
     format_speed,
     is_video,
+    parse_links,
     run_downloader,
     run_mpv,
 )
 
+# Tab ID -> category, in tab order
+TAB_CATEGORIES = {
+    "tab-games": CATEGORY_GAMES,
+    "tab-movies": CATEGORY_MOVIES,
+    "tab-series": CATEGORY_SERIES,
+    "tab-all": CATEGORY_ALL,
+}
+
+# aria2 notification -> download status
+ARIA2_EVENT_STATUS = {
+    "onDownloadStart": "active",
+    "onDownloadPause": "paused",
+    "onDownloadStop": "removed",
+    "onDownloadComplete": "complete",
+    "onBtDownloadComplete": "complete",
+    "onDownloadError": "error",
+}
+
 # pyperclip is optional – if missing, show a message
 try:
     import pyperclip  # type: ignore
@@ -46,6 +89,29 @@ except Exception:
     pyperclip = None  # type: ignore
 
 
+@lru_cache(maxsize=None)
+def _queue_progress_bar(pct: int) -> Text:
+    """Create a visual progress bar for queue items (shared per percentage)."""
+    bar_width = 20
+    filled = int(bar_width * pct / 100)
+    empty = bar_width - filled
+    bar = "█" * filled + "░" * empty
+
+    # Color based on progress
+    if pct >= 100:
+        color = "green bold"
+    elif pct >= 75:
+        color = "cyan"
+    elif pct >= 50:
+        color = "yellow"
+    elif pct >= 25:
+        color = "orange1"
+    else:
+        color = "red"
+
+    return Text(f"{bar} {pct:3d}%", style=color)
+
+
 class RDTUI(App):
     """Main Real-Debrid TUI application."""
 
@@ -87,21 +153,48 @@ class RDTUI(App):
     ]
 
     rd: Optional[RDClient] = None
+    _warmup_task: Optional[asyncio.Task] = None
     cfg: Dict[str, Any] = {}
     status_text: reactive[str] = reactive("Gotowy.")
 
     # Multi-select and filter
     selected_ids: set[str] = set()
     filter_text: reactive[str] = reactive("")
-    active_category: reactive[str] = reactive("Wszystko")  # Tabs: Gry, Filmy, Seriale, Wszystko
-    _all_rows: List[TorrentRow] = []
+    active_category: reactive[str] = reactive(CATEGORY_ALL)  # Tabs: Gry, Filmy, Seriale, Wszystko
+    library: TorrentLibrary
+    _filter_timer: Optional[Timer] = None
+    _view_generation: int = 0  # Bumped by every torrents table render
 
     # UI state flags
     queue_active: reactive[bool] = reactive(False)
     _modal_open: bool = False  # Prevent multiple modals
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the application state."""
+        super().__init__(*args, **kwargs)
+        self.search_index = SearchIndex()
+        # Use fuzzy search with threshold of 50 (better precision)
+        self.search_session = SearchSession(self.search_index, threshold=50)
+        # Held by the filter worker while it reads the index and by the
+        # library while it updates it
+        self._search_lock = threading.Lock()
+        self.library = TorrentLibrary(index=self.search_index, index_lock=self._search_lock)
+
     def watch_filter_text(self, old_value: str, new_value: str) -> None:
-        """Auto-refresh table when filter text changes."""
+        """Refresh the table once typing pauses (rapid keystrokes coalesce)."""
+        if self._filter_timer is not None:
+            # Superseded by this keystroke
+            self._filter_timer.stop()
+            self._filter_timer = None
+        delay = float(self.cfg.get("filter_debounce", 0.15))
+        if delay <= 0:
+            self._apply_filter()
+        else:
+            self._filter_timer = self.set_timer(delay, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        """Render the table for the current filter text."""
+        self._filter_timer = None
         if hasattr(self, 'table') and self.table.is_mounted:
             self._render_table()
 
@@ -113,13 +206,21 @@ class RDTUI(App):
     # aria2 RPC and queue
     aria2: Optional[Aria2RPC] = None
     download_tasks: Dict[str, Dict[str, Any]] = {}
+    # Queue window: offset of the first row and aria2 totals (getGlobalStat)
+    _queue_offset: int = 0
+    _queue_counts: Dict[str, int] = {}
+    _queue_sliding: bool = False
+    queue_poller: QueuePoller
 
     def compose(self) -> ComposeResult:
         """Compose the application UI."""
         yield Header(show_clock=True)
         with Container():
             # Category tabs
-            self.tabs = Tabs("Gry", "Filmy", "Seriale", "Wszystko", id="tabs")
+            self.tabs = Tabs(
+                *(Tab(category, id=tab_id) for tab_id, category in TAB_CATEGORIES.items()),
+                id="tabs",
+            )
             yield self.tabs
 
             # Filter bar (hidden until active)
@@ -164,11 +265,40 @@ class RDTUI(App):
         except Exception:
             pass
         self.table.focus()
+        # Periodic refresh of aria2 queue (runs only while the panel is shown)
+        self.queue_poller = QueuePoller(
+            self,
+            self._poll_queue,
+            self._queue_poll_interval,
+            idle_interval=float(self.cfg.get("aria2_idle_poll_interval", 30.0)),
+        )
         await self.setup_client()
         await self.setup_aria2()
         await self.action_refresh()
-        # periodic refresh of aria2 queue
-        self.set_interval(2.0, self.refresh_queue, pause=not self.queue_table.display)
+        # Status line and RD request budget in the header
+        self.set_interval(1.0, self._update_subtitle)
+
+    def _retry_policy(self) -> RetryPolicy:
+        """Build the retry policy for API clients from the config."""
+        return RetryPolicy(
+            max_attempts=int(self.cfg.get("retry_max_attempts", 4)),
+            backoff_base=float(self.cfg.get("retry_backoff_base", 0.5)),
+            backoff_max=float(self.cfg.get("retry_backoff_max", 8.0)),
+            jitter=float(self.cfg.get("retry_jitter", 0.5)),
+            retry_statuses=frozenset(
+                int(c) for c in self.cfg.get("retry_statuses", [500, 502, 503, 504])
+            ),
+        )
+
+    def _http_limits(self) -> httpx.Limits:
+        """Build connection pool limits for API clients from the config."""
+        return httpx.Limits(
+            max_connections=int(self.cfg.get("http_max_connections", 10)),
+            max_keepalive_connections=int(
+                self.cfg.get("http_max_keepalive_connections", 10)
+            ),
+            keepalive_expiry=float(self.cfg.get("http_keepalive_expiry", 30.0)),
+        )
 
     async def setup_client(self):
         """Set up the Real-Debrid API client."""
@@ -176,25 +306,64 @@ class RDTUI(App):
         if not token:
             self.notify("Ustaw API key w [g] Ustawieniach.", severity="warning")
             return
+        self._cancel_warmup()
         if self.rd:
             await self.rd.close()
-        self.rd = RDClient(token)
+        link_cache = None
+        if self.cfg.get("unrestrict_cache_enabled", True):
+            link_cache = UnrestrictCache(
+                token_scoped_path(get_config_dir(), token),
+                ttl=float(self.cfg.get("unrestrict_cache_ttl", 4 * 3600)),
+                max_entries=int(self.cfg.get("unrestrict_cache_max_entries", 2000)),
+            )
+        self.rd = RDClient(
+            token,
+            link_cache=link_cache,
+            info_ttl=float(self.cfg.get("torrent_info_ttl", 10.0)),
+            limiter=TokenBucket(
+                rate_per_minute=float(self.cfg.get("rd_rate_limit_per_minute", 250)),
+                burst=int(self.cfg.get("rd_rate_burst", 25)),
+            ),
+            retry=self._retry_policy(),
+            timeout=float(self.cfg.get("rd_timeout", 30.0)),
+            limits=self._http_limits(),
+            http2=bool(self.cfg.get("rd_http2", True)),
+        )
+        # Open connections in the background while the user call runs
+        # (the task is kept so it is not collected mid-flight and can be
+        # cancelled before the client is closed)
+        self._warmup_task = asyncio.create_task(
+            self.rd.warmup(int(self.cfg.get("rd_prewarm_connections", 2)))
+        )
         try:
             u = await self.rd.user()
             self.notify(f"Zalogowano jako {u.get('username','?')} ✅")
         except Exception as e:
             self.notify(f"Błąd autoryzacji: {e}", severity="error")
 
+    def _cancel_warmup(self) -> None:
+        """Cancel the connection warmup if it is still running."""
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+
     async def setup_aria2(self):
         """Initialize aria2 RPC if enabled; autostart if necessary."""
         if not self.cfg.get("aria2_rpc_enabled", False):
             return
         url = self.cfg.get("aria2_rpc_url", "http://127.0.0.1:6800/jsonrpc")
         secret = self.cfg.get("aria2_rpc_secret", "")
-        self.aria2 = Aria2RPC(url, secret or None)
-        # Try a quick call to detect availability
+        self.aria2 = Aria2RPC(
+            url,
+            secret or None,
+            retry=self._retry_policy(),
+            timeout=float(self.cfg.get("aria2_timeout", 15.0)),
+            limits=self._http_limits(),
+        )
+        # Try a quick call to detect availability (no retries: a closed
+        # port must not delay the first screen)
         try:
-            await self.aria2.tell_active()
+            await self.aria2.tell_active(retry=False)
         except Exception:
             # Autostart if configured
             if self.cfg.get("aria2_autostart", True):
@@ -224,13 +393,124 @@ class RDTUI(App):
                     return
             # Try again
             try:
-                await self.aria2.tell_active()
+                await self.aria2.tell_active(retry=False)
             except Exception as e:
                 self.notify(f"Brak połączenia z aria2 RPC: {e}", severity="warning")
                 self.aria2 = None
+                return
+        # Prefer the WebSocket: one persistent connection plus push notifications
+        if self.cfg.get("aria2_rpc_transport", "websocket") == "websocket":
+            if await self.aria2.connect_ws():
+                self.aria2.add_listener(self._on_aria2_event)
+
+    def _on_aria2_event(self, event: str, gid: str) -> None:
+        """Apply an aria2 push notification to the download tasks."""
+        status = ARIA2_EVENT_STATUS.get(event)
+        if not status:
+            return
+        task = self.download_tasks.setdefault(gid, {})
+        old_status = task.get("status")
+        task["status"] = status
+        filename = task.get("filename", gid)
+        if status == "complete" and old_status != "complete":
+            self._send_notification("Pobieranie zakończone", f"✅ {filename}")
+        elif status == "error" and old_status != "error":
+            self.notify(f"Błąd pobierania: {filename}", severity="error")
+        self.queue_poller.poke()
+
+    def _queue_poll_interval(self) -> float:
+        """Get the queue poll cadence; a slow heartbeat while push notifications work."""
+        if self.aria2 and self.aria2.ws_connected:
+            return float(self.cfg.get("aria2_heartbeat_interval", 10.0))
+        return 2.0
+
+    async def _poll_queue(self) -> bool:
+        """Refresh the queue for the poller; True while downloads are in progress."""
+        await self.refresh_queue()
+        c = self._queue_counts
+        return bool(c.get("numActive", 0) or c.get("numWaiting", 0))
+
+    def _queue_window_size(self) -> int:
+        """Get the number of queue items fetched per poll."""
+        return max(10, int(self.cfg.get("aria2_queue_window", 100)))
+
+    def _queue_total(self) -> int:
+        """Get the number of items in the whole aria2 queue (last known)."""
+        c = self._queue_counts
+        return c.get("numActive", 0) + c.get("numWaiting", 0) + c.get("numStopped", 0)
+
+    def _queue_window_offset(self, cursor_row: Optional[int]) -> int:
+        """Get the queue window offset for the current cursor row.
+
+        The window stays put while the cursor is in its middle half and is
+        re-centred on the cursor once it gets close to either edge.
+
+        Args:
+            cursor_row: Cursor row in the queue table, if any
+        """
+        if cursor_row is None:
+            return self._queue_offset
+        window = self._queue_window_size()
+        rows = self.queue_table.row_count
+        margin = window // 4
+        near_end = cursor_row >= rows - margin and self._queue_offset + rows < self._queue_total()
+        near_start = cursor_row < margin and self._queue_offset > 0
+        if not (near_end or near_start):
+            return self._queue_offset
+        return max(0, self._queue_offset + cursor_row - window // 2)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Slide the queue window as soon as the cursor nears its edge."""
+        if event.data_table is not self.queue_table or self._queue_sliding:
+            return
+        # The event may predate a window change; use the live cursor
+        row = self.queue_table.cursor_coordinate.row
+        if self._queue_window_offset(row) != self._queue_offset:
+            self._queue_sliding = True
+            self.run_worker(self._slide_queue(), group="queue-slide")
+
+    async def _slide_queue(self) -> None:
+        """Refresh the queue for a moved window."""
+        try:
+            await self.refresh_queue()
+        finally:
+            self._queue_sliding = False
+
+    def watch_status_text(self, old_value: str, new_value: str) -> None:
+        """Show status changes in the header right away."""
+        self._update_subtitle()
+
+    def _update_subtitle(self) -> None:
+        """Show the status line, RD request budget and queued requests in the header."""
+        text = self.status_text
+        if self.rd:
+            st = self.rd.rate_status()
+            text += f" · RD: {st['tokens']}/{st['capacity']} zapytań"
+            if st["waiting"]:
+                text += f" · w kolejce {st['waiting']}"
+            if st["blocked_for"]:
+                text += f" · limit RD, wznowienie za {st['blocked_for']:.0f}s"
+        if self._queue_counts:
+            c = self._queue_counts
+            text += (
+                f" · aria2: {c.get('numActive', 0)} aktywne,"
+                f" {c.get('numWaiting', 0)} oczekujące,"
+                f" {c.get('numStopped', 0)} zakończone"
+            )
+            rows = self.queue_table.row_count
+            if self.queue_table.display and rows < self._queue_total():
+                first = self._queue_offset + 1 if rows else 0
+                text += f" (widok {first}–{self._queue_offset + rows})"
+            if self.queue_poller.running:
+                text += f" · odświeżanie co {self.queue_poller.interval:.0f}s"
+        if self.table.virtual and self.table.total_rows:
+            text += f" · {self.table.cursor_position + 1}/{self.table.total_rows}"
+        if self.sub_title != text:
+            self.sub_title = text
 
     async def on_unmount(self):
         """Clean up resources on unmount."""
+        self._cancel_warmup()
         if self.rd:
             await self.rd.close()
         if self.aria2:
@@ -300,62 +580,105 @@ class RDTUI(App):
             self.notify("Brak API key.", severity="warning")
             return
         modal = InputModal(
-            "Wklej: magnet / URL do .torrent / link hostera (RD)",
+            "Wklej: magnet / URL do .torrent / link hostera (RD) — jeden lub wiele, po jednym w linii",
             "magnet:?xt=... lub https://.../plik.torrent lub https://hoster/...",
+            multiline=True,
         )
         self.mount(modal)
 
     async def action_refresh(self):
-        """Refresh the torrents list."""
+        """Refresh the torrents list.
+
+        With delta sync enabled (and a non-empty library) only the newest
+        rows are fetched and merged; otherwise the whole list is reloaded.
+        """
         if not self.rd:
             return
         try:
-            ts = await self.rd.torrents()
+            if self.cfg.get("delta_sync_enabled", True) and len(self.library):
+                delta = await self._delta_sync()
+            else:
+                delta = await self._full_sync()
+            # Status/progress changed or torrent gone -> memoized info is stale
+            self.rd.invalidate_torrent_info(*delta.updated, *delta.deleted)
 
-            # Deduplicate by ID - keep first occurrence
-            seen_ids = set()
-            unique_rows = []
-            for t in ts:
+            # Keep selection only for existing IDs
+            self.selected_ids = {i for i in self.selected_ids if i in self.library}
+            if delta:
+                self._render_table()
+        except Exception as e:
+            self.notify(f"Błąd odświeżania: {e}", severity="error")
+
+    async def _full_sync(self) -> LibraryDelta:
+        """Reload the whole torrent list, rendering each page as it arrives."""
+        assert self.rd is not None
+        delta = LibraryDelta()
+        seen_ids: set[str] = set()
+        pages = self.rd.iter_torrent_pages(
+            first_page_size=int(self.cfg.get("torrents_first_page_size", 100)),
+            page_size=int(self.cfg.get("torrents_page_size", 1000)),
+            concurrency=int(self.cfg.get("torrents_fetch_concurrency", 4)),
+        )
+        # Render every page as it arrives so the first screen shows up
+        # after a single small request
+        async for page in pages:
+            rows = []
+            for t in page:
                 row = TorrentRow.from_info(t)
+                # Deduplicate by ID - keep first occurrence
                 if row.id not in seen_ids:
                     seen_ids.add(row.id)
-                    unique_rows.append(row)
-
-            self._all_rows = unique_rows
+                    rows.append(row)
+            page_delta = self.library.upsert(rows)
+            if page_delta:
+                delta.extend(page_delta)
+                self._render_table()
+        delta.extend(self.library.retain(seen_ids))
+        return delta
+
+    async def _delta_sync(self) -> LibraryDelta:
+        """Fetch newest-first pages until a run of unchanged rows and merge them.
+
+        The scan does not stop before it has seen every known torrent that
+        is still in progress, however old, so its status and progress are
+        refreshed too. Falls back to a full reload when the merged library size does not
+        match the server's total count (e.g. deletions outside the window).
+        """
+        assert self.rd is not None
+        limit = max(1, int(self.cfg.get("delta_sync_page_size", 50)))
+        stop_after = max(1, int(self.cfg.get("delta_sync_stop_after", 10)))
+        window: List[TorrentRow] = []
+        offset = 0
+        unchanged = 0
+        reached_end = False
+        total: Optional[int] = None
+        # Known rows that may still change on their own
+        pending = {row.id for row in self.library.rows() if row.status not in SETTLED_STATUSES}
+        done = False
+        while not done:
+            items, total = await self.rd.torrents_page(offset, limit)
+            for t in items:
+                row = TorrentRow.from_info(t)
+                window.append(row)
+                pending.discard(row.id)
+                unchanged = unchanged + 1 if self.library.get(row.id) == row else 0
+                if unchanged >= stop_after and not pending:
+                    done = True
+                    break
+            if len(items) < limit:
+                reached_end = True
+                break
+            offset += len(items)
 
-            # Keep selection only for existing IDs
-            self.selected_ids = {
-                i for i in self.selected_ids if any(r.id == i for r in self._all_rows)
-            }
-            self._render_table()
-        except Exception as e:
-            self.notify(f"Błąd odświeżania: {e}", severity="error")
+        delta = self.library.merge_window(window, reached_end)
+        if total is not None and len(self.library) != total:
+            delta.extend(await self._full_sync())
+        return delta
 
     def _row_selected_icon(self, tid: str) -> str:
         """Get the selection icon for a row."""
         return "✅" if tid in self.selected_ids else " "
 
-    def _make_queue_progress_bar(self, pct: int) -> Text:
-        """Create a visual progress bar for queue items."""
-        bar_width = 20
-        filled = int(bar_width * pct / 100)
-        empty = bar_width - filled
-        bar = "█" * filled + "░" * empty
-
-        # Color based on progress
-        if pct >= 100:
-            color = "green bold"
-        elif pct >= 75:
-            color = "cyan"
-        elif pct >= 50:
-            color = "yellow"
-        elif pct >= 25:
-            color = "orange1"
-        else:
-            color = "red"
-
-        return Text(f"{bar} {pct:3d}%", style=color)
-
     def _send_notification(self, title: str, message: str):
         """Send system notification (macOS/Windows/Linux)."""
         try:
@@ -371,121 +694,155 @@ class RDTUI(App):
             pass
 
     def _render_table(self):
-        """Render the torrents table while preserving cursor position."""
-        # Save current cursor position (row index and column index)
-        old_cursor_row = None
-        old_cursor_col = None
-        current_row_key = None
-
-        try:
-            if self.table.row_count > 0:
-                old_cursor_row = self.table.cursor_coordinate.row
-                old_cursor_col = self.table.cursor_coordinate.column
-                # Try to get the current row key to restore position by key
-                current_row_key = self._current_tid()
-        except Exception:
-            pass
+        """Render the torrents table, updating only rows and cells that changed.
+
+        Filtering, scoring and sorting run in a worker thread so typing
+        stays responsive on large libraries; only applying the result to
+        the table runs on the event loop. A newer render cancels the one
+        still being computed. The table keeps the cursor on the same
+        torrent. Large views are virtualized: only the rows around the
+        viewport are materialized.
+        """
+        self._update_tab_counts()
+        self._view_generation += 1
+        cat = self.active_category or CATEGORY_ALL
+        query = self.filter_text.strip()
+        # The library is only mutated on the event loop, so the category
+        # rows are taken here; filtered views come from the search index
+        rows = None if query else self.library.rows(None if cat == CATEGORY_ALL else cat)
+        self.run_worker(
+            partial(
+                self._compute_view,
+                self._view_generation,
+                cat,
+                query,
+                rows,
+                self.table.window_size(),
+                self.table.cursor_key(),
+            ),
+            name="render-table",
+            group="render-table",
+            exclusive=True,
+            thread=True,
+        )
 
-        self.table.clear()
-        rows = self._filtered_rows()
-        # sort: newest first
-        rows.sort(key=lambda r: r.added or datetime.fromtimestamp(0), reverse=True)
+    def _compute_view(
+        self,
+        generation: int,
+        cat: str,
+        query: str,
+        rows: Optional[List[TorrentRow]],
+        window: int,
+        cursor_key: Optional[str],
+    ) -> None:
+        """Filter and order the rows of a view (runs in a worker thread).
+
+        Args:
+            generation: Render request the view belongs to
+            cat: Active category
+            query: Filter text (empty for no filter)
+            rows: Rows of the category, used when there is no filter
+            window: Number of rows to rank up front in virtual mode
+            cursor_key: Torrent under the cursor when the render was requested
+        """
+        worker = get_current_worker()
+        if rows is None:
+            # The search session narrows from its previous query, so it is
+            # used by one worker at a time; the library takes the same lock
+            # to update the index, and every update requests a newer render.
+            with self._search_lock:
+                if worker.is_cancelled:
+                    return
+                rows = self._filtered_rows(cat, query)
+        if worker.is_cancelled:
+            return
 
-        # Track added keys to avoid duplicates
-        added_keys = set()
-        new_row_index = None  # Track where the current row key ended up
+        threshold = int(self.cfg.get("table_virtualize_threshold", 2000))
+        cursor: Optional[Tuple[Optional[str], Optional[int]]] = None
+        if 0 < threshold < len(rows):
+            # Virtual table: rank only the first window (newest first),
+            # the rest is sorted if the user scrolls past it
+            ranking = LazyRanking(rows, attrgetter("sort_key"), k=window)
+            view: Any = ranking
+            lookup = ranking.get
+            virtual = True
+            # Locate the cursor here: past the first window this sorts the
+            # whole view, which must not happen on the loop
+            position = ranking.index(cursor_key) if cursor_key in ranking else None
+            cursor = (cursor_key, position)
+        else:
+            # sort: newest first
+            rows.sort(key=attrgetter("sort_key"), reverse=True)
+            by_id = {row.id: row for row in rows}
+            view = list(by_id)
+            lookup = by_id.get
+            virtual = False
+        if worker.is_cancelled:
+            return
+        self.call_from_thread(self._apply_view, generation, view, lookup, virtual, cursor)
+
+    def _apply_view(
+        self,
+        generation: int,
+        keys: Sequence[str],
+        lookup: Callable[[str], Optional[TorrentRow]],
+        virtual: bool,
+        cursor: Optional[Tuple[Optional[str], Optional[int]]],
+    ) -> None:
+        """Show a computed view unless a newer render was requested meanwhile."""
+        if generation != self._view_generation or not self.table.is_mounted:
+            return
+        self.table.show_rows(
+            keys, lambda tid: self._torrent_cells(lookup(tid)), virtual=virtual, cursor=cursor
+        )
 
-        for idx, row in enumerate(rows):
-            # Skip duplicates
-            if row.id in added_keys:
-                continue
+    def _torrent_cells(self, row: TorrentRow) -> Tuple[Any, ...]:
+        """Build the table cells of a torrent row."""
+        return (
+            self._row_selected_icon(row.id),
+            row.pretty_filename(max_width=70, selected=False),  # Więcej miejsca bez ID
+            row.pretty_size(),
+            row.pretty_progress_bar(),
+            row.pretty_added(),
+            row.pretty_status(),
+        )
 
-            try:
-                self.table.add_row(
-                    self._row_selected_icon(row.id),
-                    row.pretty_filename(max_width=70, selected=False),  # Więcej miejsca bez ID
-                    row.pretty_size(),
-                    row.pretty_progress_bar(),
-                    row.pretty_added(),
-                    row.pretty_status(),
-                    key=row.id,
-                )
-                added_keys.add(row.id)
+    def _filtered_rows(self, cat: str, query: str) -> List[TorrentRow]:
+        """Get the rows of a category matching the text filter.
 
-                # Track if this is the row we were on
-                if current_row_key and row.id == current_row_key:
-                    new_row_index = idx
+        Args:
+            cat: Category (CATEGORY_ALL for every category)
+            query: Non-empty filter text
+        """
+        # The index scores only rows containing every query character, and
+        # a query extending the previous one re-scores only its matches;
+        # rows are ordered by the table, so scores are not sorted here
+        results = self.search_session.search(query)
 
-            except Exception as e:
-                # Skip rows that cause errors (e.g., duplicate keys)
-                continue
+        # Extract just the rows (discard scores), keeping the category filter
+        if cat == CATEGORY_ALL:
+            return [row for score, row in results]
+        return [row for score, row in results if row.category == cat]
 
-        # Restore cursor position
-        if rows:
+    def on_tabs_tab_activated(self, event):  # type: ignore[override]
+        """Handle tab activation (watch_active_category re-renders)."""
+        tab = getattr(event, "tab", None)
+        category = TAB_CATEGORIES.get(getattr(tab, "id", None) or "")
+        if category:
+            self.active_category = category
+
+    def _update_tab_counts(self) -> None:
+        """Show the number of torrents per category in the tab labels."""
+        counts = self.library.counts()
+        counts[CATEGORY_ALL] = len(self.library)
+        for tab_id, category in TAB_CATEGORIES.items():
+            label = f"{category} ({counts.get(category, 0)})"
             try:
-                if new_row_index is not None and old_cursor_col is not None:
-                    # Restore to the same row (by key) and column
-                    self.table.move_cursor(row=new_row_index, column=old_cursor_col)
-                elif old_cursor_row is not None and old_cursor_col is not None:
-                    # Fallback: restore to same row index (if still valid)
-                    max_row = len(rows) - 1
-                    safe_row = min(old_cursor_row, max_row)
-                    self.table.move_cursor(row=safe_row, column=old_cursor_col)
-                else:
-                    # Default: move to top
-                    self.table.cursor_coordinate = (0, 0)
+                tab = self.tabs.query_one(f"#{tab_id}", Tab)
             except Exception:
-                pass
-
-    def _filtered_rows(self) -> List[TorrentRow]:
-        """Get filtered rows based on category and text filter."""
-        rows = list(self._all_rows)
-        # Category filter
-        cat = (self.active_category or "Wszystko").lower()
-        if cat != "wszystko":
-            rows = [r for r in rows if self._row_category(r).lower() == cat]
-        # Text filter with fuzzy search
-        if not self.filter_text:
-            return rows
-
-        # Import fuzzy search
-        from rdtui.utils.search import fuzzy_search
-
-        q = self.filter_text.strip()
-        # Use fuzzy search with threshold of 50 (better precision)
-        results = fuzzy_search(q, rows, threshold=50)
-
-        # Extract just the rows (discard scores)
-        return [row for score, row in results]
-
-    def _row_category(self, r: TorrentRow) -> str:
-        """Determine the category of a torrent row."""
-        name = (r.filename or "").lower()
-        # Simple heuristic: "Filmy" if typical movie pattern, "Seriale" if S01E01/season/episode, else "Gry"
-        if (
-            re.search(r"\bS\d{1,2}E\d{1,2}\b", name)
-            or "season" in name
-            or "episode" in name
-        ):
-            return "Seriale"
-        # Movies – video file without series pattern
-        if is_video(name):
-            return "Filmy"
-        return "Gry"
-
-    def on_tabs_tab_activated(self, event):  # type: ignore[override]
-        """Handle tab activation."""
-        try:
-            label = getattr(event, "tab", None) or getattr(event, "label", None)
-            # Textual >=0.58 emits object with .tab.label, older may pass string
-            if hasattr(label, "label"):
-                label = label.label
-            if not label:
-                return
-            self.active_category = str(label)
-            self._render_table()
-        except Exception:
-            pass
+                continue
+            if tab.label_text != label:
+                tab.label = label
 
     def _selected_or_current_ids(self) -> List[str]:
         """Get selected IDs or current ID if none selected."""
@@ -588,28 +945,13 @@ class RDTUI(App):
         if not tid:
             return
 
-        # Save cursor position
-        old_row = None
-        old_col = None
-        try:
-            old_row = self.table.cursor_row
-            old_col = self.table.cursor_column
-        except Exception:
-            pass
-
         if tid in self.selected_ids:
             self.selected_ids.remove(tid)
         else:
             self.selected_ids.add(tid)
 
-        self._render_table()
-
-        # Restore cursor position
-        if old_row is not None and old_col is not None:
-            try:
-                self.table.move_cursor(row=old_row, column=old_col)
-            except Exception:
-                pass
+        # Only the ✓ cell of this row changes
+        self.table.set_cell(tid, 0, self._row_selected_icon(tid))
 
     async def action_toggle_filter(self):
         """Toggle filter bar visibility."""
@@ -634,23 +976,78 @@ class RDTUI(App):
             pass
 
     async def action_delete(self):
-        """Delete selected or current torrents."""
+        """Delete selected or current torrents.
+
+        Deletions run concurrently; confirmed rows leave the library at
+        once, the table is re-rendered at most every 0.25 s while they run
+        and once at the end. Only the failed ones are re-synced afterwards.
+        """
         if not self.rd:
             return
         ids = self._selected_or_current_ids()
         if not ids:
             return
-        try:
-            for tid in ids:
-                await self.rd.delete_torrent(tid)
+        sem = asyncio.Semaphore(max(1, int(self.cfg.get("delete_concurrency", 8))))
+        deleted = 0
+        failed: List[str] = []
+        errors: List[Exception] = []
+        last_render = time.monotonic()
+
+        async def delete(tid: str) -> None:
+            nonlocal deleted, last_render
+            try:
+                async with sem:
+                    await self.rd.delete_torrent(tid)  # type: ignore[union-attr]
+            except Exception as e:
+                failed.append(tid)
+                errors.append(e)
+                return
+            deleted += 1
+            self.selected_ids.discard(tid)
+            self.library.remove([tid])
             if len(ids) > 1:
-                self.notify(f"Usunięto {len(ids)} pozycji ❌")
-            else:
-                self.notify("Usunięto ❌")
-            self.selected_ids.clear()
-            await self.action_refresh()
-        except Exception as e:
-            self.notify(f"Błąd usuwania: {e}", severity="error")
+                self.status_text = f"Usuwanie… {deleted}/{len(ids)}"
+            # Throttled: the render also updates tab counts and the
+            # virtual view, which per-row table edits would leave stale
+            now = time.monotonic()
+            if now - last_render >= 0.25:
+                last_render = now
+                self._render_table()
+
+        await asyncio.gather(*(delete(tid) for tid in ids))
+        self.status_text = "Gotowy."
+        if deleted:
+            self._render_table()
+
+        if deleted > 1:
+            self.notify(f"Usunięto {deleted} pozycji ❌")
+        elif deleted:
+            self.notify("Usunięto ❌")
+        if failed:
+            self.notify(
+                f"Błąd usuwania ({len(failed)}): {errors[0]}", severity="error"
+            )
+            await self._resync_rows(failed)
+
+    async def _resync_rows(self, tids: List[str]) -> None:
+        """Re-fetch individual torrents and update their rows.
+
+        Args:
+            tids: Torrent IDs whose state is uncertain
+        """
+        assert self.rd is not None
+        self.rd.invalidate_torrent_info(*tids)
+        results = await asyncio.gather(
+            *(self.rd.torrent_info(tid) for tid in tids), return_exceptions=True
+        )
+        delta = LibraryDelta()
+        for tid, info in zip(tids, results):
+            if isinstance(info, httpx.HTTPStatusError) and info.response.status_code == 404:
+                delta.extend(self.library.remove([tid]))
+            elif isinstance(info, dict):
+                delta.extend(self.library.upsert([TorrentRow.from_info(info)]))
+        if delta:
+            self._render_table()
 
     async def _collect_links(self, tid: str) -> List[Tuple[str, str]]:
         """Collect direct download links for a torrent.
@@ -672,46 +1069,55 @@ class RDTUI(App):
         links = info.get("links") or []
         self.notify(f"📦 Znaleziono {len(links)} linków dla {tid}", severity="information")
 
-        out: List[Tuple[str, str]] = []
+        # Resolve links concurrently; the semaphore keeps us polite towards RD
+        sem = asyncio.Semaphore(max(1, int(self.cfg.get("unrestrict_concurrency", 6))))
 
-        # 1) Prefer links list; unrestrict every link for a real direct URL and filename
-        for url in links:
+        async def resolve(url: str) -> Optional[Tuple[str, str]]:
             try:
-                unr = await self.rd.unrestrict_link(url)
+                async with sem:
+                    unr = await self.rd.unrestrict_link(url)  # type: ignore[union-attr]
                 direct = unr.get("download") or unr.get("link") or url
                 fname = unr.get("filename") or url.split("/")[-1]
-                out.append((fname, direct))
+                return (fname, direct)
             except Exception as e:
                 # If unrestrict fails, log and try original
                 self.notify(f"⚠️ Błąd unrestrict: {e}", severity="warning")
                 # Check if link is already direct (starts with https://...)
                 if url.startswith("http"):
                     fname = url.split("/")[-1].split("?")[0]  # Remove query params
-                    out.append((fname, url))
-
-        if out:
-            return out
+                    return (fname, url)
+                return None
 
-        # 2) Fallback: unrestrict original host links (if present)
-        origs = info.get("original", []) or []
-        for item in origs:
+        async def resolve_original(item: Dict[str, Any]) -> Optional[Tuple[str, str]]:
             lnk = item.get("link") or item.get("download")
             if not lnk:
-                continue
+                return None
             try:
-                unr = await self.rd.unrestrict_link(lnk)
+                async with sem:
+                    unr = await self.rd.unrestrict_link(lnk)  # type: ignore[union-attr]
                 direct = unr.get("download") or unr.get("link") or lnk
                 fname = (
                     unr.get("filename")
                     or item.get("filename")
                     or direct.split("/")[-1]
                 )
-                out.append((fname, direct))
+                return (fname, direct)
             except Exception as e:
                 self.notify(f"⚠️ Błąd unrestrict (fallback): {e}", severity="warning")
-                continue
+                return None
+
+        # 1) Prefer links list; unrestrict every link for a real direct URL and filename
+        # (gather keeps results in input order)
+        results = await asyncio.gather(*(resolve(url) for url in links))
+        out: List[Tuple[str, str]] = [r for r in results if r]
+
+        if out:
+            return out
 
-        return out
+        # 2) Fallback: unrestrict original host links (if present)
+        origs = info.get("original", []) or []
+        results = await asyncio.gather(*(resolve_original(item) for item in origs))
+        return [r for r in results if r]
 
     async def refresh_queue(self):
         """Refresh the download queue from aria2 while preserving cursor position."""
@@ -722,29 +1128,39 @@ class RDTUI(App):
         ):
             return
 
-        # Save current cursor position in queue table
-        old_cursor_row = None
-        old_cursor_col = None
-        current_gid = None
+        # Cursor row decides which part of the queue is fetched
+        old_cursor_row = (
+            self.queue_table.cursor_coordinate.row if self.queue_table.row_count else None
+        )
 
-        try:
-            if self.queue_table.row_count > 0:
-                old_cursor_row = self.queue_table.cursor_coordinate.row
-                old_cursor_col = self.queue_table.cursor_coordinate.column
-                # Try to get the current GID to restore position by key
-                current_gid = self._current_gid()
-        except Exception:
-            pass
+        # Reconnect the WebSocket if it dropped (no-op when connected)
+        if (
+            self.cfg.get("aria2_rpc_transport", "websocket") == "websocket"
+            and not self.aria2.ws_connected
+        ):
+            await self.aria2.connect_ws()
 
-        # Build a fresh view of tasks by asking aria2
+        # Fetch only the window around the cursor; totals come along. A
+        # failed poll is not retried: the poller calls again anyway
+        window = self._queue_window_size()
+        self._queue_offset = self._queue_window_offset(old_cursor_row)
         try:
-            active = await self.aria2.tell_active()
-            waiting = await self.aria2.tell_waiting(0, 100)
-            stopped = await self.aria2.tell_stopped(0, 100)
-            items = active + waiting + stopped
+            items, self._queue_counts = await self.aria2.tell_window(
+                self._queue_offset, window, self._queue_counts, retry=False
+            )
         except Exception as e:
             self.notify(f"Błąd odświeżania kolejki: {e}", severity="error")
             return
+        if not items and self._queue_offset > 0:
+            # Queue shrank below the window; start over from the top
+            self._queue_offset = 0
+            try:
+                items, self._queue_counts = await self.aria2.tell_window(
+                    0, window, self._queue_counts, retry=False
+                )
+            except Exception as e:
+                self.notify(f"Błąd odświeżania kolejki: {e}", severity="error")
+                return
 
         # Update internal tasks dict with results
         for it in items:
@@ -783,47 +1199,29 @@ class RDTUI(App):
                 "eta": eta,
             }
 
-        # Render table (stable order for nicer UI)
-        self.queue_table.clear()
-        sorted_gids = sorted(self.download_tasks.keys())
-        new_row_index = None  # Track where the current GID ended up
-
-        for idx, gid in enumerate(sorted_gids):
+        # Update the window in place, in aria2 order (active, waiting, stopped);
+        # the table keeps the cursor on the same GID
+        rows = []
+        for it in items:
+            gid = it.get("gid")
+            if not gid:
+                continue
             info = self.download_tasks[gid]
-            pct = info.get("progress_pct", 0)
-            progress_bar = self._make_queue_progress_bar(pct)
-
-            self.queue_table.add_row(
-                info.get("filename", gid),
-                info.get("size", "?"),
-                info.get("status", "?"),
-                progress_bar,
-                info.get("speed", "0 B/s"),
-                info.get("eta", "?"),
-                info.get("dir", ""),
-                key=gid,
+            rows.append(
+                (
+                    gid,
+                    (
+                        info.get("filename", gid),
+                        info.get("size", "?"),
+                        info.get("status", "?"),
+                        _queue_progress_bar(info.get("progress_pct", 0)),
+                        info.get("speed", "0 B/s"),
+                        info.get("eta", "?"),
+                        info.get("dir", ""),
+                    ),
+                )
             )
-
-            # Track if this is the row we were on
-            if current_gid and gid == current_gid:
-                new_row_index = idx
-
-        # Restore cursor position
-        try:
-            if getattr(self.queue_table, "row_count", 0) > 0:
-                if new_row_index is not None and old_cursor_col is not None:
-                    # Restore to the same row (by GID) and column
-                    self.queue_table.move_cursor(row=new_row_index, column=old_cursor_col)
-                elif old_cursor_row is not None and old_cursor_col is not None:
-                    # Fallback: restore to same row index (if still valid)
-                    max_row = len(sorted_gids) - 1
-                    safe_row = min(old_cursor_row, max_row)
-                    self.queue_table.move_cursor(row=safe_row, column=old_cursor_col)
-                else:
-                    # Default: move to top
-                    self.queue_table.cursor_coordinate = (0, 0)
-        except Exception:
-            pass
+        self.queue_table.sync_rows(rows)
 
     async def action_queue_open_location(self):
         """Open directory of the selected queue item in OS file manager."""
@@ -893,14 +1291,13 @@ class RDTUI(App):
         """Toggle download queue visibility."""
         self.queue_table.display = not self.queue_table.display
         if self.queue_table.display:
-            # resume timer and focus queue table
-            self.set_interval(2.0, self.refresh_queue, pause=False)
+            # resume polling (the first poll runs right away) and focus queue table
             self.queue_active = True
-            await self.refresh_queue()
+            self.queue_poller.start()
             self.focus_on_queue()
         else:
-            # pause timer and focus torrents list
-            self.set_interval(2.0, self.refresh_queue, pause=True)
+            # stop polling and focus torrents list
+            self.queue_poller.stop()
             self.queue_active = False
             self.focus_on_table()
 
@@ -934,28 +1331,11 @@ class RDTUI(App):
                 dl_dir.mkdir(parents=True, exist_ok=True)
 
                 if use_rpc:
-                    # Add to aria2 queue via RPC
-                    for fname, url in links:
-                        try:
-                            gid = await self.aria2.add_uri(
-                                [url], out=fname, dir=str(dl_dir)
-                            )  # type: ignore[arg-type]
-                            self.download_tasks[gid] = {
-                                "tid": tid,
-                                "filename": fname,
-                                "dir": str(dl_dir),
-                                "status": "queued",
-                                "progress": "0%",
-                                "speed": "0 B/s",
-                                "eta": "?",
-                            }
-                        except Exception as e:
-                            self.notify(f"Błąd aria2: {e}", severity="error")
-                    self.notify(f"Dodano do kolejki {len(links)} plików → aria2 ⬇️")
-                    # Ensure queue visible and timer running
-                    if not self.queue_table.display:
-                        self.queue_table.display = True
-                        self.set_interval(2.0, self.refresh_queue, pause=False)
+                    # Enqueue the whole torrent in a single aria2 round trip
+                    failed = await self._enqueue_aria2(links, dl_dir, tid)
+                    queued = len(links) - len(failed)
+                    if queued:
+                        self.notify(f"Dodano do kolejki {queued} plików → aria2 ⬇️")
                 else:
                     # Fallback: run downloader in background tasks
                     self.notify(f"Pobieranie {len(links)} plików do {dl_dir}… ⬇️")
@@ -1063,44 +1443,153 @@ class RDTUI(App):
         raw = (msg.value or "").strip()
         await self._process_link(raw)
 
+    def _describe_error(self, e: Exception) -> str:
+        """Format an exception, preferring the RD error message if present."""
+        if isinstance(e, httpx.HTTPStatusError):
+            try:
+                data = e.response.json()
+                msg = data.get("error")
+                code = data.get("error_code")
+                if msg:
+                    return f"Błąd RD: {msg} (code {code})"
+            except Exception:
+                pass
+            return f"HTTP {e.response.status_code}: {e}"
+        return f"Błąd dodawania: {e}"
+
+    async def _add_torrent_source(self, link: str, link_type: str) -> str:
+        """Add a magnet or .torrent URL to RD and select all its files.
+
+        Returns:
+            Torrent ID, or an empty string if RD did not create a torrent
+        """
+        assert self.rd is not None
+        if link_type == "magnet":
+            r = await self.rd.add_magnet(link)
+        else:
+            r = await self.rd.add_torrent_from_url(link)
+        tid = r.get("id") or r.get("torrent") or r.get("hash") or ""
+        if tid:
+            await self.rd.select_all(tid)
+        return tid
+
+    def _link_download_dir(self) -> Path:
+        """Get the download directory for hoster links."""
+        return Path(
+            self.cfg.get("download_dir", str(Path.home() / "Downloads" / "rdtui"))
+        )
+
+    async def _enqueue_aria2(
+        self, links: List[Tuple[str, str]], dl_dir: Path, tid: Optional[str] = None
+    ) -> List[Tuple[str, str]]:
+        """Add files to aria2 in a single round trip and track them in the queue.
+
+        Args:
+            links: List of (filename, direct_url) tuples
+            dl_dir: Download directory
+            tid: Torrent ID the files belong to, if any
+
+        Returns:
+            The (filename, direct_url) tuples aria2 did not accept
+        """
+        assert self.aria2 is not None
+        try:
+            results = await self.aria2.add_uris(
+                [([url], fname) for fname, url in links], dir=str(dl_dir)
+            )
+        except Exception as e:
+            self.notify(f"Błąd aria2: {e}", severity="error")
+            return list(links)
+
+        failed: List[Tuple[str, str]] = []
+        errors: List[Exception] = []
+        for (fname, url), res in zip(links, results):
+            if isinstance(res, Exception):
+                failed.append((fname, url))
+                errors.append(res)
+                continue
+            self.download_tasks[res] = {
+                "tid": tid,
+                "filename": fname,
+                "dir": str(dl_dir),
+                "status": "queued",
+                "progress": "0%",
+                "speed": "0 B/s",
+                "eta": "?",
+            }
+        if errors:
+            self.notify(f"Błąd aria2 ({len(errors)}): {errors[0]}", severity="error")
+        if len(failed) < len(links):
+            # Ensure queue visible and show the new items right away
+            self.queue_table.display = True
+            if self.queue_poller.running:
+                self.queue_poller.poke()
+            else:
+                self.queue_poller.start()
+        return failed
+
+    async def _queue_directs(
+        self, links: List[Tuple[str, str]], dl_dir: Path, quiet: bool = False
+    ) -> None:
+        """Queue direct links in aria2 RPC, falling back to the local downloader.
+
+        Args:
+            links: List of (filename, direct_url) tuples
+            dl_dir: Download directory
+            quiet: Skip success notifications (bulk imports report a summary)
+        """
+        use_rpc = self.cfg.get("aria2_rpc_enabled", False) and self.aria2 is not None
+        if use_rpc:
+            links = await self._enqueue_aria2(links, dl_dir)
+            if not links:
+                if not quiet:
+                    self.notify("Dodano do kolejki aria2 ⬇️")
+                return
+            # Fallback to local download for whatever aria2 rejected
+        for fname, direct in links:
+            asyncio.create_task(
+                run_downloader(
+                    self.cfg.get("downloader", "aria2c"),
+                    direct,
+                    dl_dir,
+                    filename=fname,
+                )
+            )
+        if not quiet:
+            self.notify("Pobieranie uruchomione w tle ✅")
+
     async def _process_link(self, raw: str):
-        """Process a magnet/torrent/hoster link."""
+        """Process pasted magnet/torrent/hoster link(s)."""
         if not self.rd:
             self.notify("Brak API key.", severity="warning")
             return
-        raw = raw.strip()
+        links = parse_links(raw)
+        if len(links) > 1:
+            await self._import_links(links)
+            return
+        raw = links[0][0] if links else ""
+        link_type = links[0][1] if links else "unknown"
         try:
-            # 1) Magnet
-            if raw.startswith("magnet:"):
-                self.notify("Dodawanie magnetu…")
-                r = await self.rd.add_magnet(raw)
-                tid = r.get("id") or r.get("torrent") or r.get("hash") or ""
+            # 1) Magnet / 2) URL to .torrent -> upload to RD
+            if link_type in ("magnet", "torrent_url"):
+                if link_type == "magnet":
+                    self.notify("Dodawanie magnetu…")
+                else:
+                    self.notify("Dodawanie torrenta z URL…")
+                tid = await self._add_torrent_source(raw, link_type)
                 if not tid:
-                    self.notify("Nie udało się utworzyć torrenta", severity="error")
+                    self.notify(
+                        "Nie udało się utworzyć torrenta"
+                        + (" (.torrent)" if link_type == "torrent_url" else ""),
+                        severity="error",
+                    )
                     return
-                await self.rd.select_all(tid)
                 self.notify("Wybrano wszystkie pliki. Przetwarzanie w toku… 🔄")
                 await self.action_refresh()
                 return
 
-            # 2) HTTP(S) URL: .torrent or hoster
-            if raw.startswith("http://") or raw.startswith("https://"):
-                # Heuristic: URL to .torrent -> upload to RD
-                if re.search(r"\.torrent(\?|$)", raw, re.IGNORECASE):
-                    self.notify("Dodawanie torrenta z URL…")
-                    r = await self.rd.add_torrent_from_url(raw)
-                    tid = r.get("id") or r.get("torrent") or r.get("hash") or ""
-                    if not tid:
-                        self.notify(
-                            "Nie udało się utworzyć torrenta (.torrent)",
-                            severity="error",
-                        )
-                        return
-                    await self.rd.select_all(tid)
-                    self.notify("Wybrano wszystkie pliki. Przetwarzanie w toku… 🔄")
-                    await self.action_refresh()
-                    return
-                # Otherwise: hoster URL -> unrestrict and download
+            # 3) Otherwise: hoster URL -> unrestrict and download
+            if link_type == "hoster_or_direct":
                 self.notify("Przetwarzanie linku hostera przez RD…")
                 unr = await self.rd.unrestrict_link(raw)
                 direct = unr.get("download") or unr.get("link")
@@ -1109,82 +1598,76 @@ class RDTUI(App):
                     self.notify(f"Nie udało się unrestrict: {err}", severity="error")
                     return
                 fname = unr.get("filename") or direct.split("/")[-1]
-                dl_dir = Path(
-                    self.cfg.get(
-                        "download_dir", str(Path.home() / "Downloads" / "rdtui")
-                    )
-                )
-                use_rpc = (
-                    self.cfg.get("aria2_rpc_enabled", False)
-                    and self.aria2 is not None
-                )
-                if use_rpc:
-                    try:
-                        gid = await self.aria2.add_uri(
-                            [direct], out=fname, dir=str(dl_dir)
-                        )  # type: ignore[arg-type]
-                        self.download_tasks[gid] = {
-                            "tid": None,
-                            "filename": fname,
-                            "dir": str(dl_dir),
-                            "status": "queued",
-                            "progress": "0%",
-                            "speed": "0 B/s",
-                            "eta": "?",
-                        }
-                        # Ensure queue visible and timer running
-                        if not self.queue_table.display:
-                            self.queue_table.display = True
-                            self.set_interval(2.0, self.refresh_queue, pause=False)
-                        self.notify("Dodano do kolejki aria2 ⬇️")
-                    except Exception as e:
-                        self.notify(f"Błąd aria2: {e}", severity="error")
-                        # Fallback to local download
-                        asyncio.create_task(
-                            run_downloader(
-                                self.cfg.get("downloader", "aria2c"),
-                                direct,
-                                dl_dir,
-                                filename=fname,
-                            )
-                        )
-                        self.notify("Pobieranie uruchomione w tle ✅")
-                else:
-                    asyncio.create_task(
-                        run_downloader(
-                            self.cfg.get("downloader", "aria2c"),
-                            direct,
-                            dl_dir,
-                            filename=fname,
-                        )
-                    )
-                    self.notify("Pobieranie uruchomione w tle ✅")
+                await self._queue_directs([(fname, direct)], self._link_download_dir())
                 return
 
-            # 3) Unknown format
+            # 4) Unknown format
             self.notify(
                 "Wklej magnet / URL do .torrent / link hostera.", severity="warning"
             )
-        except httpx.HTTPStatusError as e:
-            # Try to show RD error message
-            try:
-                data = e.response.json()
-                msg = data.get("error")
-                code = data.get("error_code")
-                if msg:
-                    self.notify(f"Błąd RD: {msg} (code {code})", severity="error")
-                    return
-            except Exception:
-                pass
-            self.notify(f"HTTP {e.response.status_code}: {e}", severity="error")
         except Exception as e:
-            self.notify(f"Błąd dodawania: {e}", severity="error")
+            self.notify(self._describe_error(e), severity="error")
+
+    async def _import_links(self, links: List[Tuple[str, str]]) -> None:
+        """Import many links concurrently with a single refresh at the end.
+
+        Args:
+            links: Classified links from parse_links
+        """
+        assert self.rd is not None
+        valid = [(link, kind) for link, kind in links if kind != "unknown"]
+        skipped = len(links) - len(valid)
+        if not valid:
+            self.notify(
+                "Wklej magnet / URL do .torrent / link hostera.", severity="warning"
+            )
+            return
+        self.notify(f"Importowanie {len(valid)} linków…")
+        sem = asyncio.Semaphore(max(1, int(self.cfg.get("import_concurrency", 4))))
+        dl_dir = self._link_download_dir()
+        added = 0
+        errors: List[str] = []
+        directs: List[Tuple[str, str]] = []
+
+        async def import_one(link: str, kind: str) -> None:
+            nonlocal added
+            try:
+                async with sem:
+                    if kind in ("magnet", "torrent_url"):
+                        if not await self._add_torrent_source(link, kind):
+                            raise RuntimeError("Nie udało się utworzyć torrenta")
+                    else:
+                        unr = await self.rd.unrestrict_link(link)  # type: ignore[union-attr]
+                        direct = unr.get("download") or unr.get("link")
+                        if not direct:
+                            raise RuntimeError(unr.get("error") or "Brak direct link z RD")
+                        fname = unr.get("filename") or direct.split("/")[-1]
+                        # Queued together once every link is resolved
+                        directs.append((fname, direct))
+                added += 1
+            except Exception as e:
+                errors.append(self._describe_error(e))
+            self.status_text = f"Importowanie… {added + len(errors)}/{len(valid)}"
+
+        await asyncio.gather(*(import_one(link, kind) for link, kind in valid))
+        if directs:
+            await self._queue_directs(directs, dl_dir, quiet=True)
+        self.status_text = "Gotowy."
+
+        summary = f"Zaimportowano {added}/{len(valid)} linków 🔄"
+        if skipped:
+            summary += f" (pominięto nierozpoznane: {skipped})"
+        self.notify(summary, severity="warning" if errors else "information")
+        if errors:
+            self.notify(f"Błędy importu ({len(errors)}): {errors[0]}", severity="error")
+        if any(kind != "hoster_or_direct" for _, kind in valid):
+            await self.action_refresh()
 
     def on_input_changed(self, event: Input.Changed) -> None:  # type: ignore[override]
         """Handle filter input changes."""
         if event.input.id == "filter":
+            # watch_filter_text renders after the debounce delay
             self.filter_text = event.value
-            self._render_table()
 
     # Global key fallback to ensure actions work even when widgets capture keys
     def on_key(self, event):  # type: ignore[override]
@@ -19,6 +19,55 @@ DEFAULT_CONFIG = {
     "aria2_rpc_secret": "",
     "aria2_autostart": True,
     "download_queue_visible": False,
+    # "websocket" (push notifications, falls back to HTTP if unreachable) or "http"
+    "aria2_rpc_transport": "websocket",
+    # Queue poll interval (s) while WebSocket notifications are available
+    "aria2_heartbeat_interval": 10.0,
+    # Longest queue poll interval (s) while nothing is downloading
+    "aria2_idle_poll_interval": 30.0,
+    # Queue items fetched per poll; the window follows the queue cursor
+    "aria2_queue_window": 100,
+    # Delay (s) after the last filter keystroke before the table re-renders
+    "filter_debounce": 0.15,
+    # Torrents above which only the rows around the viewport are rendered (0 = never)
+    "table_virtualize_threshold": 2000,
+    # Torrent list fetching
+    "torrents_first_page_size": 100,
+    "torrents_page_size": 1000,
+    "torrents_fetch_concurrency": 4,
+    # Incremental refresh: scan newest-first pages until a run of unchanged rows
+    "delta_sync_enabled": True,
+    "delta_sync_page_size": 50,
+    "delta_sync_stop_after": 10,
+    # Maximum number of concurrent /unrestrict/link calls
+    "unrestrict_concurrency": 6,
+    # Maximum number of concurrent torrent deletions
+    "delete_concurrency": 8,
+    # Maximum number of links imported at once from a multi-line paste
+    "import_concurrency": 4,
+    # On-disk cache of unrestricted links (TTL in seconds)
+    "unrestrict_cache_enabled": True,
+    "unrestrict_cache_ttl": 4 * 3600,
+    "unrestrict_cache_max_entries": 2000,
+    # Seconds torrent info of an unfinished torrent is reused (finished: forever)
+    "torrent_info_ttl": 10.0,
+    # Client-side RD request budget (RD allows 250 requests per minute)
+    "rd_rate_limit_per_minute": 250,
+    "rd_rate_burst": 25,
+    # Retry of transient failures (timeouts, resets, 5xx) and request timeouts
+    "retry_max_attempts": 4,
+    "retry_backoff_base": 0.5,
+    "retry_backoff_max": 8.0,
+    "retry_jitter": 0.5,
+    "retry_statuses": [500, 502, 503, 504],
+    "rd_timeout": 30.0,
+    "aria2_timeout": 15.0,
+    # Connection pooling (HTTP/2 for RD uses the h2 package from httpx[http2])
+    "http_max_connections": 10,
+    "http_max_keepalive_connections": 10,
+    "http_keepalive_expiry": 30.0,
+    "rd_http2": True,
+    "rd_prewarm_connections": 2,
 }
 
 
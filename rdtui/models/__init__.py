@@ -1,6 +1,23 @@
 """Data models for Real-Debrid TUI."""
 
-from rdtui.models.torrent import TorrentRow
-
-__all__ = ["TorrentRow"]
+from rdtui.models.category import (
+    CATEGORY_ALL,
+    CATEGORY_GAMES,
+    CATEGORY_MOVIES,
+    CATEGORY_SERIES,
+    categorize,
+)
+from rdtui.models.library import LibraryDelta, TorrentLibrary
+from rdtui.models.torrent import SETTLED_STATUSES, TorrentRow
 
+__all__ = [
+    "CATEGORY_ALL",
+    "CATEGORY_GAMES",
+    "CATEGORY_MOVIES",
+    "CATEGORY_SERIES",
+    "categorize",
+    "LibraryDelta",
+    "SETTLED_STATUSES",
+    "TorrentLibrary",
+    "TorrentRow",
+]
@@ -0,0 +1,83 @@
+"""Torrent categories shown as tabs."""
+
+import re
+from typing import List, Sequence, Tuple
+
+VIDEO_EXTS = {".mkv", ".mp4", ".avi", ".mov", ".webm", ".m4v"}
+
+# Tab labels
+CATEGORY_ALL = "Wszystko"
+CATEGORY_GAMES = "Gry"
+CATEGORY_MOVIES = "Filmy"
+CATEGORY_SERIES = "Seriale"
+CATEGORIES = (CATEGORY_GAMES, CATEGORY_MOVIES, CATEGORY_SERIES)
+
+# (category, regex on the lowercased name) in priority order; the first
+# matching rule wins, names matching no rule get the default category
+CATEGORY_RULES: List[Tuple[str, str]] = [
+    # S01E01 / season / episode
+    (CATEGORY_SERIES, r"\bs\d{1,2}e\d{1,2}\b|season|episode"),
+    # Movies – video file without series pattern
+    (
+        CATEGORY_MOVIES,
+        r"\.(?:%s)$" % "|".join(sorted(ext.lstrip(".") for ext in VIDEO_EXTS)),
+    ),
+]
+
+
+class CategoryMatcher:
+    """Classifies names with all rules compiled into a single regex.
+
+    Each rule becomes a lookahead alternative anchored at the start of the
+    name, tried in priority order, so one ``match`` call decides the
+    category no matter how many rules there are.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str]], default: str = CATEGORY_GAMES):
+        """Compile the rules.
+
+        Args:
+            rules: (category, regex) tuples in priority order; regexes see
+                the lowercased name
+            default: Category of names matching no rule
+        """
+        self.default = default
+        self._categories = [category for category, _ in rules]
+        alternatives = [
+            rf"(?=[\s\S]*?(?:{pattern}))(?P<r{i}>)" for i, (_, pattern) in enumerate(rules)
+        ]
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+
+    def classify(self, name_lower: str) -> str:
+        """Get the category of a lowercased name."""
+        if self._regex is None:
+            return self.default
+        m = self._regex.match(name_lower)
+        if m is None:
+            return self.default
+        return self._categories[int(m.lastgroup[1:])]  # type: ignore[index]
+
+
+_matcher = CategoryMatcher(CATEGORY_RULES)
+
+
+def set_category_matcher(matcher: CategoryMatcher) -> None:
+    """Replace the matcher used for rows created from now on.
+
+    Args:
+        matcher: Matcher whose categories are among CATEGORIES
+    """
+    global _matcher
+    _matcher = matcher
+
+
+def categorize(name_lower: str) -> str:
+    """Determine the category of a torrent from its lowercased name.
+
+    Args:
+        name_lower: Lowercased torrent filename
+
+    Returns:
+        One of CATEGORIES (never CATEGORY_ALL)
+    """
+    return _matcher.classify(name_lower)
@@ -0,0 +1,166 @@
+"""In-memory torrent library keyed by torrent ID."""
+
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from rdtui.models.category import CATEGORIES
+from rdtui.models.torrent import TorrentRow
+
+
+@dataclass
+class LibraryDelta:
+    """Changes applied to the library by a single sync step."""
+
+    inserted: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def extend(self, other: "LibraryDelta") -> None:
+        """Merge another delta into this one."""
+        self.inserted.extend(other.inserted)
+        self.updated.extend(other.updated)
+        self.deleted.extend(other.deleted)
+
+
+class TorrentLibrary:
+    """Last known state of the user's torrents, keyed by torrent ID.
+
+    Rows are also indexed by category, so listing or counting a category
+    does not scan the whole library.
+    """
+
+    def __init__(
+        self,
+        index: Optional[Any] = None,
+        index_lock: Optional[AbstractContextManager] = None,
+    ):
+        """Initialize an empty library.
+
+        Args:
+            index: Optional secondary index kept in sync with the rows
+                (anything with ``add(row)`` and ``remove(tid)``, e.g.
+                rdtui.utils.search.SearchIndex)
+            index_lock: Held while the index is updated, for indexes that
+                are also read from other threads
+        """
+        self._index = index
+        self._index_lock = index_lock if index_lock is not None else nullcontext()
+        self._rows: Dict[str, TorrentRow] = {}
+        # category -> IDs (dicts keep insertion order)
+        self._by_category: Dict[str, Dict[str, None]] = {c: {} for c in CATEGORIES}
+
+    def __len__(self) -> int:
+        """Get the number of known torrents."""
+        return len(self._rows)
+
+    def __contains__(self, tid: object) -> bool:
+        """Check whether a torrent ID is known."""
+        return tid in self._rows
+
+    def get(self, tid: str) -> Optional[TorrentRow]:
+        """Get a row by torrent ID."""
+        return self._rows.get(tid)
+
+    def rows(self, category: Optional[str] = None) -> List[TorrentRow]:
+        """Get rows in insertion order.
+
+        Args:
+            category: Only rows of this category; all rows if None
+        """
+        if category is None:
+            return list(self._rows.values())
+        rows = self._rows
+        return [rows[tid] for tid in self._by_category.get(category, ())]
+
+    def counts(self) -> Dict[str, int]:
+        """Get the number of rows per category."""
+        return {c: len(ids) for c, ids in self._by_category.items()}
+
+    def ids(self) -> Set[str]:
+        """Get the set of known torrent IDs."""
+        return set(self._rows)
+
+    def upsert(self, rows: Iterable[TorrentRow]) -> LibraryDelta:
+        """Insert new rows and replace rows whose state changed.
+
+        Args:
+            rows: Rows fetched from the API
+        """
+        delta = LibraryDelta()
+        changed: List[TorrentRow] = []
+        for row in rows:
+            old = self._rows.get(row.id)
+            if old is None:
+                delta.inserted.append(row.id)
+            elif old != row:
+                delta.updated.append(row.id)
+                self._by_category[old.category].pop(row.id, None)
+            else:
+                continue
+            self._rows[row.id] = row
+            self._by_category.setdefault(row.category, {})[row.id] = None
+            changed.append(row)
+        if self._index is not None and changed:
+            with self._index_lock:
+                for row in changed:
+                    self._index.add(row)
+        return delta
+
+    def remove(self, tids: Iterable[str]) -> LibraryDelta:
+        """Remove rows by torrent ID.
+
+        Args:
+            tids: Torrent IDs to remove
+        """
+        delta = LibraryDelta()
+        for tid in tids:
+            row = self._rows.pop(tid, None)
+            if row is not None:
+                self._by_category[row.category].pop(tid, None)
+                delta.deleted.append(tid)
+        if self._index is not None and delta.deleted:
+            with self._index_lock:
+                for tid in delta.deleted:
+                    self._index.remove(tid)
+        return delta
+
+    def retain(self, tids: Set[str]) -> LibraryDelta:
+        """Remove every row whose ID is not in ``tids``.
+
+        Args:
+            tids: Torrent IDs that still exist
+        """
+        return self.remove([tid for tid in self._rows if tid not in tids])
+
+    def merge_window(self, rows: List[TorrentRow], reached_end: bool) -> LibraryDelta:
+        """Apply a newest-first window of rows fetched from the API.
+
+        Rows missing from the window are deleted only when they are newer
+        than the oldest row in it (or when the window covers the whole list),
+        since anything older simply was not fetched.
+
+        Args:
+            rows: Newest-first prefix of the API torrent list
+            reached_end: True if the window covers the whole list
+        """
+        delta = self.upsert(rows)
+        seen = {row.id for row in rows}
+        if reached_end:
+            delta.extend(self.retain(seen))
+            return delta
+        dated = [row.added for row in rows if row.added is not None]
+        if not dated:
+            return delta
+        oldest = min(dated)
+        gone = [
+            tid
+            for tid, row in self._rows.items()
+            if tid not in seen and row.added is not None and row.added > oldest
+        ]
+        delta.extend(self.remove(gone))
+        return delta
@@ -1,17 +1,77 @@
 """Torrent data model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 import humanize
 from dateutil import parser as dtparser
 from rich.text import Text
 
-
-@dataclass
+from rdtui.models.category import categorize
+
+
+# status -> (icon, color, Polish label)
+STATUS_CONFIG: Dict[str, Tuple[str, str, str]] = {
+    "queued": ("⏳", "yellow", "W kolejce"),
+    "downloading": ("🔽", "cyan bold", "Pobieranie"),
+    "uploading": ("🔼", "blue", "Wysyłanie"),
+    "magnet_error": ("⚠️", "orange", "Błąd magnet"),
+    "error": ("❌", "red bold", "Błąd"),
+    "virus": ("🦠", "magenta bold", "Wirus"),
+    "finished": ("✅", "green bold", "Pobrane"),
+    "downloaded": ("✅", "green bold", "Pobrane"),
+    "waiting_files_selection": ("🧲", "yellow", "Wybór plików"),
+    "compressing": ("📦", "blue", "Kompresja"),
+    "dead": ("💀", "red", "Martwy"),
+}
+
+# Statuses a torrent does not leave on its own (nothing left to poll)
+SETTLED_STATUSES = frozenset({"downloaded", "error", "magnet_error", "virus", "dead"})
+
+
+@lru_cache(maxsize=None)
+def _status_text(status: str) -> Text:
+    """Build the status cell (shared by all rows with this status)."""
+    icon, color, polish = STATUS_CONFIG.get(status, ("🔷", "white", status))
+    return Text(f"{icon} {polish}", style=color)
+
+
+@lru_cache(maxsize=None)
+def _progress_bar(pct: int) -> Text:
+    """Build the progress bar cell (shared by all rows with this percentage)."""
+    # 20 bloków = 100%
+    filled = int(pct / 5)
+    empty = 20 - filled
+
+    # Wybierz kolor na podstawie postępu
+    if pct == 100:
+        color = "green"
+    elif pct >= 75:
+        color = "cyan"
+    elif pct >= 50:
+        color = "yellow"
+    elif pct >= 25:
+        color = "orange"
+    else:
+        color = "red"
+
+    # Użyj różnych znaków dla wypełnienia i pustych
+    bar = "█" * filled + "░" * empty
+
+    return Text(f"{bar} {pct:3d}%", style=color)
+
+
+@dataclass(slots=True)
 class TorrentRow:
-    """Represents a torrent row in the UI table."""
+    """Represents a torrent row in the UI table.
+
+    Derived fields (lowercased name, category, sort key) are computed once
+    when the row is created; rows are replaced, not mutated, when the
+    torrent changes, so rendered cells are cached in fixed slots without
+    checking what they were built from.
+    """
 
     id: str
     filename: str
@@ -19,6 +79,25 @@ class TorrentRow:
     progress: float
     added: Optional[datetime]
     size: int
+    # Derived once in __post_init__
+    name_lower: str = field(init=False, repr=False, compare=False)
+    category: str = field(init=False, repr=False, compare=False)
+    sort_key: datetime = field(init=False, repr=False, compare=False)
+    # Rendered cells, built on first use
+    _added_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _size_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _name_cell: Optional[Text] = field(default=None, init=False, repr=False, compare=False)
+    _name_width: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Compute the derived fields used by filtering, sorting and rendering."""
+        name_lower = self.filename.lower()
+        # Share the string when the name is already lowercase
+        self.name_lower = self.filename if name_lower == self.filename else name_lower
+        self.category = categorize(self.name_lower)
+        # Newest first when sorted in reverse; undated rows go last (the
+        # datetime itself is the key, so no extra object per row)
+        self.sort_key = self.added or datetime.min
 
     @classmethod
     def from_info(cls, t: Dict[str, Any]) -> "TorrentRow":
@@ -43,30 +122,19 @@ class TorrentRow:
 
     def pretty_status(self) -> Text:
         """Return a formatted status with icon and color."""
-        status_config = {
-            "queued": ("⏳", "yellow", "W kolejce"),
-            "downloading": ("🔽", "cyan bold", "Pobieranie"),
-            "uploading": ("🔼", "blue", "Wysyłanie"),
-            "magnet_error": ("⚠️", "orange", "Błąd magnet"),
-            "error": ("❌", "red bold", "Błąd"),
-            "virus": ("🦠", "magenta bold", "Wirus"),
-            "finished": ("✅", "green bold", "Pobrane"),
-            "downloaded": ("✅", "green bold", "Pobrane"),
-            "waiting_files_selection": ("🧲", "yellow", "Wybór plików"),
-            "compressing": ("📦", "blue", "Kompresja"),
-            "dead": ("💀", "red", "Martwy"),
-        }
-
-        icon, color, polish = status_config.get(self.status, ("🔷", "white", self.status))
-        return Text(f"{icon} {polish}", style=color)
+        return _status_text(self.status)
 
     def pretty_size(self) -> str:
         """Return a human-readable file size."""
-        return humanize.naturalsize(self.size, gnu=True)
+        if self._size_str is None:
+            self._size_str = humanize.naturalsize(self.size, gnu=True)
+        return self._size_str
 
     def pretty_added(self) -> str:
         """Return a formatted date string."""
-        return self.added.strftime("%Y-%m-%d %H:%M") if self.added else "—"
+        if self._added_str is None:
+            self._added_str = self.added.strftime("%Y-%m-%d %H:%M") if self.added else "—"
+        return self._added_str
 
     def pretty_progress(self) -> str:
         """Return a formatted progress percentage."""
@@ -74,28 +142,7 @@ class TorrentRow:
 
     def pretty_progress_bar(self) -> Text:
         """Return a visual progress bar with percentage."""
-        pct = int(self.progress)
-
-        # 20 bloków = 100%
-        filled = int(pct / 5)
-        empty = 20 - filled
-
-        # Wybierz kolor na podstawie postępu
-        if pct == 100:
-            color = "green"
-        elif pct >= 75:
-            color = "cyan"
-        elif pct >= 50:
-            color = "yellow"
-        elif pct >= 25:
-            color = "orange"
-        else:
-            color = "red"
-
-        # Użyj różnych znaków dla wypełnienia i pustych
-        bar = "█" * filled + "░" * empty
-
-        return Text(f"{bar} {pct:3d}%", style=color)
+        return _progress_bar(int(self.progress))
 
     def pretty_filename(self, max_width: int = 50, selected: bool = False) -> Text:
         """Return filename, truncated or scrolling if selected.
@@ -106,22 +153,25 @@ class TorrentRow:
         """
         name = self.filename
 
-        if len(name) <= max_width:
-            return Text(name)
+        if not selected or len(name) <= max_width:
+            if self._name_cell is not None and self._name_width == max_width:
+                return self._name_cell
+            if len(name) <= max_width:
+                out = Text(name)
+            else:
+                # Jeśli nie zaznaczony - po prostu utnij z wielokropkiem
+                out = Text(name[:max_width - 3] + "...")
+            self._name_cell = out
+            self._name_width = max_width
+            return out
 
         # Jeśli zaznaczony i długi - efekt przewijania (marquee)
-        if selected:
-            # Użyj czasu do animacji przewijania
-            import time
-            offset = int(time.time() * 2) % (len(name) + 5)  # Przewijaj co 0.5s
-
-            # Stwórz efekt przewijania z powtórzeniem
-            scrolling = name + "  ···  " + name
-            visible = scrolling[offset:offset + max_width]
+        # Użyj czasu do animacji przewijania
+        import time
+        offset = int(time.time() * 2) % (len(name) + 5)  # Przewijaj co 0.5s
 
-            return Text(visible, style="bold cyan")
-        else:
-            # Jeśli nie zaznaczony - po prostu utnij z wielokropkiem
-            truncated = name[:max_width - 3] + "..."
-            return Text(truncated)
+        # Stwórz efekt przewijania z powtórzeniem
+        scrolling = name + "  ···  " + name
+        visible = scrolling[offset:offset + max_width]
 
+        return Text(visible, style="bold cyan")
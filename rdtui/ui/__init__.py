@@ -7,6 +7,7 @@ from rdtui.ui.modals import (
     QuickPasteModal,
     SettingsModal,
 )
+from rdtui.ui.poller import QueuePoller
 from rdtui.ui.tables import QueueTable, TorrentsTable
 
 __all__ = [
@@ -15,6 +16,7 @@ __all__ = [
     "InputModal",
     "QuickPasteModal",
     "SettingsModal",
+    "QueuePoller",
     "QueueTable",
     "TorrentsTable",
 ]
@@ -1,12 +1,13 @@
 """Modal dialog components."""
 
 from typing import Any, Dict
-import re
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
-from textual.widgets import Button, Input, Label, Static
+from textual.widgets import Button, Input, Label, Static, TextArea
+
+from rdtui.utils.links import parse_links
 
 
 class HelpModal(Static):
@@ -33,7 +34,7 @@ class HelpModal(Static):
             [
                 "[b]Strzałki[/b] – nawigacja po liście",
                 "[b]spacja[/b] – zaznacz/odznacz wiersz (multi-select)",
-                "[b]a[/b] – dodaj plik (🧲)",
+                "[b]a[/b] – dodaj plik (🧲) — wiele linków naraz: po jednym w linii",
                 "[b]Ctrl+V[/b] – szybkie wklejenie ze schowka (✨ NOWE!)",
                 "[b]f[/b] – filtr w locie (🔎 fuzzy search)",
                 "[b]l[/b] – kopiuj link(i) do schowka (🔗)",
@@ -73,30 +74,48 @@ class InputModal(Static):
     DEFAULT_CSS = """
     InputModal { background: $panel; border: round $success; padding: 1 2; width: 80%; }
     Input { width: 100%; }
+    InputModal TextArea { width: 100%; height: 8; }
     """
 
-    def __init__(self, title: str, placeholder: str = "", password: bool = False):
+    def __init__(
+        self,
+        title: str,
+        placeholder: str = "",
+        password: bool = False,
+        multiline: bool = False,
+    ):
         """Initialize the input modal.
 
         Args:
             title: Modal title
             placeholder: Input placeholder text
             password: Whether to mask input as password
+            multiline: Use a text area accepting many lines (e.g. a list of links)
         """
         super().__init__()
         self.title = title
         self.placeholder = placeholder
         self.password = password
+        self.multiline = multiline and not password
 
     def compose(self) -> ComposeResult:
         """Compose the input modal UI."""
         yield Label(self.title)
-        yield Input(placeholder=self.placeholder, password=self.password, id="inp")
+        if self.multiline:
+            yield TextArea(placeholder=self.placeholder, id="inp")
+        else:
+            yield Input(placeholder=self.placeholder, password=self.password, id="inp")
         yield Horizontal(Button("OK", id="ok"), Button("Anuluj", id="cancel"))
 
     def on_mount(self):
         """Focus the input field when mounted."""
-        self.query_one(Input).focus()
+        self.query_one("#inp").focus()
+
+    def _value(self) -> str:
+        """Get the entered text."""
+        if self.multiline:
+            return self.query_one(TextArea).text
+        return self.query_one(Input).value
 
     def on_button_pressed(self, ev: Button.Pressed):
         """Handle button press.
@@ -105,7 +124,7 @@ class InputModal(Static):
             ev: Button pressed event
         """
         if ev.button.id == "ok":
-            self.post_message(self.Submitted(self.query_one(Input).value))
+            self.post_message(self.Submitted(self._value()))
             self.remove()
         elif ev.button.id == "cancel":
             self.remove()
@@ -262,21 +281,18 @@ class QuickPasteModal(Static):
     def __init__(self, clipboard_content: str):
         super().__init__()
         self.clipboard_content = clipboard_content
-        self.link_type = self._detect_link_type(clipboard_content)
-
-    def _detect_link_type(self, content: str) -> str:
-        """Detect what type of link this is."""
-        content = content.strip()
-
-        if content.startswith("magnet:"):
-            return "magnet"
-        elif re.match(r"https?://.*\.(torrent)(\?|$)", content, re.IGNORECASE):
-            return "torrent_url"
-        elif re.match(r"https?://", content):
-            # Może być hoster (1fichier, rapidgator, etc.) lub direct link
-            return "hoster_or_direct"
+        # Clipboard may hold many links, one per line; surrounding text is
+        # ignored, and only the links shown here are imported on confirm
+        self.links = [
+            (link, kind) for link, kind in parse_links(clipboard_content)
+            if kind != "unknown"
+        ]
+        if len(self.links) > 1:
+            self.link_type = "multiple"
+        elif self.links:
+            self.link_type = self.links[0][1]
         else:
-            return "unknown"
+            self.link_type = "unknown"
 
     def compose(self) -> ComposeResult:
         """Compose the quick paste modal UI."""
@@ -284,6 +300,7 @@ class QuickPasteModal(Static):
             "magnet": "🧲",
             "torrent_url": "📦",
             "hoster_or_direct": "🔗",
+            "multiple": "📋",
             "unknown": "❓"
         }
 
@@ -295,7 +312,15 @@ class QuickPasteModal(Static):
         }
 
         icon = icon_map.get(self.link_type, "❓")
-        type_name = type_name_map.get(self.link_type, "Nieznany")
+        if self.link_type == "multiple":
+            counts = ", ".join(
+                f"{icon_map[kind]} {sum(1 for _, k in self.links if k == kind)}"
+                for kind in ("magnet", "torrent_url", "hoster_or_direct")
+                if any(k == kind for _, k in self.links)
+            )
+            type_name = f"{len(self.links)} linków ({counts})"
+        else:
+            type_name = type_name_map.get(self.link_type, "Nieznany")
 
         yield Label(f"{icon} Wykryto w schowku: {type_name}")
 
@@ -306,9 +331,11 @@ class QuickPasteModal(Static):
 
         yield Static(preview, classes="link-preview")
 
-        if self.link_type in ["magnet", "torrent_url", "hoster_or_direct"]:
+        if self.link_type in ["magnet", "torrent_url", "hoster_or_direct", "multiple"]:
             # Różne komunikaty w zależności od typu
-            if self.link_type == "magnet":
+            if self.link_type == "multiple":
+                yield Label("💡 Czy chcesz dodać wszystkie linki?")
+            elif self.link_type == "magnet":
                 yield Label("💡 Czy chcesz dodać ten torrent?")
             elif self.link_type == "torrent_url":
                 yield Label("💡 Czy chcesz dodać ten plik .torrent?")
@@ -326,7 +353,8 @@ class QuickPasteModal(Static):
     def on_button_pressed(self, event: Button.Pressed):
         """Handle button press."""
         if event.button.id == "confirm":
-            self.post_message(self.Confirmed(self.clipboard_content, self.link_type))
+            links = "\n".join(link for link, _ in self.links)
+            self.post_message(self.Confirmed(links, self.link_type))
         self.remove()
 
 
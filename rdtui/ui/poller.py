@@ -0,0 +1,119 @@
+"""Adaptive poll scheduler for the download queue."""
+
+from typing import Awaitable, Callable, Optional
+
+from textual.message_pump import MessagePump
+from textual.timer import Timer
+
+# Shortest delay used for "poll now" (Textual timers need a positive delay)
+MIN_DELAY = 0.05
+
+
+class QueuePoller:
+    """Single self-rescheduling timer that drives the queue refresh.
+
+    Polls at the fast cadence while downloads are in progress, backs off
+    while the queue is idle or complete, and does nothing while stopped
+    (e.g. when the queue panel is hidden).
+    """
+
+    def __init__(
+        self,
+        owner: MessagePump,
+        poll: Callable[[], Awaitable[bool]],
+        fast_interval: Callable[[], float],
+        idle_interval: float = 30.0,
+        backoff: float = 2.0,
+    ):
+        """Initialize the poller (stopped).
+
+        Args:
+            owner: App or widget owning the timer
+            poll: Coroutine refreshing the queue; returns True while
+                downloads are in progress
+            fast_interval: Returns the cadence (s) used while busy
+            idle_interval: Longest pause (s) between polls while idle
+            backoff: Factor the pause grows by after each idle poll
+        """
+        self._owner = owner
+        self._poll = poll
+        self._fast_interval = fast_interval
+        self._idle_interval = idle_interval
+        self._backoff = max(1.0, backoff)
+        self._interval = fast_interval()
+        self._timer: Optional[Timer] = None
+        self._polling = False
+        self._poll_again = False
+        self.running = False
+
+    @property
+    def interval(self) -> float:
+        """Get the current pause between polls in seconds."""
+        return self._interval
+
+    def start(self) -> None:
+        """Start polling right away at the fast cadence (no-op if running)."""
+        if self.running:
+            return
+        self.running = True
+        self._interval = self._fast_interval()
+        self._schedule(0)
+
+    def stop(self) -> None:
+        """Stop polling."""
+        self.running = False
+        self._poll_again = False
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def poke(self) -> None:
+        """Poll as soon as possible and return to the fast cadence.
+
+        Used when the queue is known to have changed (new downloads,
+        aria2 notifications). Pokes during a poll are coalesced into one
+        follow-up poll.
+        """
+        if not self.running:
+            return
+        self._interval = self._fast_interval()
+        if self._polling:
+            self._poll_again = True
+        else:
+            self._schedule(0)
+
+    def _schedule(self, delay: float) -> None:
+        """Replace the pending timer with one firing after ``delay`` seconds."""
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = self._owner.set_timer(
+            max(MIN_DELAY, delay), self._tick, name="queue-poll"
+        )
+
+    async def _tick(self) -> None:
+        """Run one poll and schedule the next one."""
+        self._timer = None
+        if not self.running or self._polling:
+            return
+        self._polling = True
+        try:
+            busy = await self._poll()
+        except Exception:
+            busy = False
+        finally:
+            self._polling = False
+        if not self.running:
+            return
+
+        fast = self._fast_interval()
+        if busy:
+            self._interval = fast
+        else:
+            self._interval = min(
+                max(self._idle_interval, fast), max(fast, self._interval * self._backoff)
+            )
+        if self._poll_again:
+            self._poll_again = False
+            self._schedule(0)
+        else:
+            self._schedule(self._interval)
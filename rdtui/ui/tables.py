@@ -1,10 +1,276 @@
 """Custom table widgets with contextual bindings."""
 
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from rich.text import Text
 from textual.binding import Binding
 from textual.widgets import DataTable
 
 
-class TorrentsTable(DataTable):
+def _cell_signature(value: Any) -> Any:
+    """Get a comparable form of a cell (Rich Text equality ignores its style)."""
+    if isinstance(value, Text):
+        return (value.plain, str(value.style), tuple(value.spans))
+    return value
+
+
+class KeyedTable(DataTable):
+    """DataTable updated in place from keyed rows instead of being rebuilt.
+
+    ``sync_rows`` diffs the wanted rows against what is on screen: rows are
+    added/removed only when keys appear/disappear, and only changed cells
+    are updated. The cursor stays on the same row key.
+
+    ``show_rows`` can also run in virtual mode, where only the visible
+    window plus an overscan is materialized from the full list of keys and
+    the window follows the cursor.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the table and its shadow copy of the displayed cells."""
+        super().__init__(*args, **kwargs)
+        self._shadow: Dict[str, Tuple[Any, ...]] = {}
+        self._order: List[str] = []
+        # Virtual mode: all keys, cell builder and first materialized position
+        self.virtual = False
+        self._model: Sequence[str] = []
+        self._build: Optional[Callable[[str], Sequence[Any]]] = None
+        self._window_start = 0
+
+    def clear(self, columns: bool = False):
+        """Clear the table and its shadow copy."""
+        self._shadow.clear()
+        self._order = []
+        self._model = []
+        self._window_start = 0
+        return super().clear(columns)
+
+    @property
+    def total_rows(self) -> int:
+        """Get the number of rows in the view, materialized or not."""
+        return len(self._model) if self.virtual else self.row_count
+
+    @property
+    def cursor_position(self) -> int:
+        """Get the cursor position in the whole view."""
+        return self._window_start + self.cursor_coordinate.row
+
+    def set_cell(self, key: str, column: int, value: Any) -> None:
+        """Update a single cell of a displayed row (no-op if not materialized).
+
+        Args:
+            key: Row key
+            column: Column index
+            value: New cell value
+        """
+        if key not in self._shadow:
+            return
+        cells = list(self._shadow[key])
+        cells[column] = value
+        self.update_cell(key, list(self.columns)[column], value, update_width=True)
+        self._shadow[key] = tuple(cells)
+
+    def cursor_key(self) -> Optional[str]:
+        """Get the row key under the cursor, if any."""
+        if not self.row_count:
+            return None
+        row = self.cursor_coordinate.row
+        if 0 <= row < len(self._order):
+            return self._order[row]
+        return None
+
+    def sync_rows(self, rows: Iterable[Tuple[str, Sequence[Any]]]) -> None:
+        """Make the table show ``rows`` in the given order, touching only changes.
+
+        Args:
+            rows: (row key, cells) tuples in display order; cells follow the
+                column order. Duplicate keys are ignored.
+        """
+        wanted: Dict[str, Sequence[Any]] = {}
+        for key, cells in rows:
+            wanted.setdefault(key, cells)
+        keys = list(wanted)
+        cursor_key = self.cursor_key()
+        cursor_row = self.cursor_coordinate.row
+
+        gone = [k for k in self._order if k not in wanted]
+        if len(gone) > len(self._order) // 2:
+            # DataTable.remove_row is O(rows); re-adding the survivors is cheaper
+            super().clear()
+            self._shadow.clear()
+            self._order = []
+        else:
+            for key in gone:
+                super().remove_row(key)
+                del self._shadow[key]
+        order = [k for k in self._order if k in wanted]
+
+        column_keys = list(self.columns)
+        for key, cells in wanted.items():
+            old = self._shadow.get(key)
+            if old is None:
+                self.add_row(*cells, key=key)
+                self._shadow[key] = tuple(cells)
+                order.append(key)
+                continue
+            merged = list(old)
+            for i, (column, before, after) in enumerate(zip(column_keys, old, cells)):
+                if before is not after and _cell_signature(before) != _cell_signature(after):
+                    self.update_cell(key, column, after, update_width=True)
+                    merged[i] = after
+            self._shadow[key] = tuple(merged)
+
+        if order != keys:
+            self._reorder(keys)
+        self._order = keys
+
+        # Keep the cursor on the same row (or the nearest one if it vanished)
+        if not keys:
+            return
+        if cursor_key in self._shadow:
+            row = keys.index(cursor_key)
+        else:
+            row = min(cursor_row, len(keys) - 1)
+        if row != self.cursor_coordinate.row:
+            self.move_cursor(row=row, column=self.cursor_coordinate.column, animate=False)
+
+    def _reorder(self, keys: List[str]) -> None:
+        """Re-add the rows in the order of ``keys``.
+
+        DataTable.sort only sees cell values, not row keys, so it cannot
+        reproduce an arbitrary order; the cells come from the shadow copy.
+        """
+        super().clear()
+        for key in keys:
+            self.add_row(*self._shadow[key], key=key)
+
+    def show_rows(
+        self,
+        keys: Sequence[str],
+        build: Callable[[str], Sequence[Any]],
+        virtual: bool = False,
+        cursor: Optional[Tuple[Optional[str], Optional[int]]] = None,
+    ) -> None:
+        """Show rows by key, building cells only for rows that get materialized.
+
+        Args:
+            keys: Row keys in display order (unique); in virtual mode only
+                the slices around the cursor are read, so a lazily sorted
+                sequence stays mostly unsorted
+            build: Returns the cells of a row key
+            virtual: Materialize only the window around the cursor
+            cursor: (cursor row key, its position in ``keys`` or None if
+                absent) located beforehand, so a lazily sorted sequence is
+                not searched here; if the cursor has moved to another key
+                since, it keeps its position instead
+        """
+        cursor_key = self.cursor_key()
+        cursor_row = self.cursor_coordinate.row
+        old_position = self._window_start + cursor_row
+        self._build = build
+        self.virtual = virtual
+        if not virtual:
+            self._model = []
+            self._window_start = 0
+            self.sync_rows((key, build(key)) for key in keys)
+            return
+
+        self._model = keys
+        if not self._model:
+            self._materialize(0, 0)
+            return
+        if cursor is not None:
+            key, position = cursor
+            target = position if key == cursor_key and position is not None else old_position
+        else:
+            try:
+                target = self._model.index(cursor_key) if cursor_key else old_position
+            except ValueError:
+                target = old_position
+        target = min(target, len(self._model) - 1)
+        # Keep the cursor on the same screen row where possible
+        self._materialize(target - cursor_row, target)
+
+    def window_size(self) -> int:
+        """Get the number of rows materialized in virtual mode."""
+        height = self.size.height or 50
+        return height + 2 * self._overscan()
+
+    def _overscan(self) -> int:
+        """Get the number of extra rows kept above and below the viewport."""
+        return max(20, self.size.height)
+
+    def _materialize(self, start: int, cursor: int) -> None:
+        """Materialize the window starting at ``start`` and put the cursor on ``cursor``.
+
+        Args:
+            start: Position of the first row to materialize (clamped)
+            cursor: Position of the cursor row in the whole view
+        """
+        assert self._build is not None
+        size = self.window_size()
+        start = max(0, min(start, len(self._model) - size))
+        self._window_start = start
+        build = self._build
+        self.sync_rows((key, build(key)) for key in self._model[start : start + size])
+        if self.row_count:
+            row = max(0, min(cursor - start, self.row_count - 1))
+            if row != self.cursor_coordinate.row:
+                self.move_cursor(row=row, animate=False)
+
+    def _recenter(self, position: int) -> None:
+        """Materialize the window centred on ``position``."""
+        self._materialize(position - self.window_size() // 2, position)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Slide the virtual window when the cursor gets close to its edge."""
+        if not self.virtual or event.data_table is not self:
+            return
+        # The event may predate a window change; use the live cursor
+        row = self.cursor_coordinate.row
+        margin = self._overscan() // 2
+        near_start = row < margin and self._window_start > 0
+        near_end = (
+            row >= self.row_count - margin
+            and self._window_start + self.row_count < len(self._model)
+        )
+        if near_start or near_end:
+            self._recenter(self._window_start + row)
+
+    def on_resize(self, _event) -> None:
+        """Re-materialize the virtual window for the new height."""
+        if self.virtual and self._model:
+            self._recenter(self.cursor_position)
+
+    def on_mouse_scroll_down(self, event) -> None:
+        """In virtual mode, scroll by moving the cursor so rows load lazily."""
+        if self.virtual:
+            event.prevent_default()
+            event.stop()
+            self.move_cursor(row=self.cursor_coordinate.row + 3)
+
+    def on_mouse_scroll_up(self, event) -> None:
+        """In virtual mode, scroll by moving the cursor so rows load lazily."""
+        if self.virtual:
+            event.prevent_default()
+            event.stop()
+            self.move_cursor(row=max(0, self.cursor_coordinate.row - 3))
+
+    def action_scroll_top(self) -> None:
+        """Move the cursor to the first row of the whole view."""
+        if self.virtual:
+            self._materialize(0, 0)
+        super().action_scroll_top()
+
+    def action_scroll_bottom(self) -> None:
+        """Move the cursor to the last row of the whole view."""
+        if self.virtual:
+            last = len(self._model) - 1
+            self._materialize(last, last)
+        super().action_scroll_bottom()
+
+
+class TorrentsTable(KeyedTable):
     """Table widget for displaying torrents with custom key bindings."""
 
     BINDINGS = [
@@ -66,7 +332,7 @@ class TorrentsTable(DataTable):
             pass
 
 
-class QueueTable(DataTable):
+class QueueTable(KeyedTable):
     """Table widget for displaying download queue with custom key bindings."""
 
     BINDINGS = [
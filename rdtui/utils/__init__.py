@@ -2,8 +2,16 @@
 
 from rdtui.utils.download import run_downloader
 from rdtui.utils.formatters import format_eta, format_progress, format_size, format_speed
+from rdtui.utils.links import detect_link_type, parse_links
 from rdtui.utils.media import is_video, run_mpv
-from rdtui.utils.search import fuzzy_search, highlight_match, simple_fuzzy_score
+from rdtui.utils.search import (
+    LazyRanking,
+    SearchIndex,
+    SearchSession,
+    fuzzy_search,
+    highlight_match,
+    simple_fuzzy_score,
+)
 
 __all__ = [
     "run_downloader",
@@ -11,8 +19,13 @@ __all__ = [
     "format_progress",
     "format_size",
     "format_speed",
+    "detect_link_type",
+    "parse_links",
     "is_video",
     "run_mpv",
+    "LazyRanking",
+    "SearchIndex",
+    "SearchSession",
     "fuzzy_search",
     "highlight_match",
     "simple_fuzzy_score",
@@ -0,0 +1,51 @@
+"""Link classification for pasted content."""
+
+import re
+from typing import List, Tuple
+
+TORRENT_URL_RE = re.compile(r"https?://.*\.(torrent)(\?|$)", re.IGNORECASE)
+HTTP_URL_RE = re.compile(r"https?://")
+
+
+def detect_link_type(content: str) -> str:
+    """Detect what type of link this is.
+
+    Args:
+        content: A single pasted link
+
+    Returns:
+        One of "magnet", "torrent_url", "hoster_or_direct" or "unknown"
+    """
+    content = content.strip()
+
+    if content.startswith("magnet:"):
+        return "magnet"
+    elif TORRENT_URL_RE.match(content):
+        return "torrent_url"
+    elif HTTP_URL_RE.match(content):
+        # Może być hoster (1fichier, rapidgator, etc.) lub direct link
+        return "hoster_or_direct"
+    else:
+        return "unknown"
+
+
+def parse_links(text: str) -> List[Tuple[str, str]]:
+    """Split pasted content into classified, deduplicated links.
+
+    Links are separated by newlines or any other whitespace (magnets and
+    URLs never contain raw whitespace).
+
+    Args:
+        text: Pasted content, one or many links
+
+    Returns:
+        List of (link, link_type) tuples in input order
+    """
+    seen = set()
+    out: List[Tuple[str, str]] = []
+    for token in text.split():
+        if token in seen:
+            continue
+        seen.add(token)
+        out.append((token, detect_link_type(token)))
+    return out
@@ -3,7 +3,7 @@
 import asyncio
 from pathlib import Path
 
-VIDEO_EXTS = {".mkv", ".mp4", ".avi", ".mov", ".webm", ".m4v"}
+from rdtui.models.category import VIDEO_EXTS
 
 
 def is_video(name: str) -> bool:
@@ -1,8 +1,15 @@
 """Search utilities for fuzzy matching."""
 
-from typing import List, Tuple
+import heapq
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
 from rdtui.models.torrent import TorrentRow
 
+# Scores below this come from the partial-match tier, which needs only one
+# common character; the index cannot prune for those
+PARTIAL_SCORE = 40
+
 
 def simple_fuzzy_score(query: str, text: str) -> int:
     """
@@ -15,9 +22,11 @@ def simple_fuzzy_score(query: str, text: str) -> int:
     - Partial match: 40
     - No match: 0
     """
-    query = query.lower()
-    text = text.lower()
-    
+    return _score(query.lower(), text.lower())
+
+
+def _score(query: str, text: str) -> int:
+    """Score already lowercased strings (see simple_fuzzy_score)."""
     # Exact match
     if query == text:
         return 100
@@ -30,12 +39,9 @@ def simple_fuzzy_score(query: str, text: str) -> int:
         return 80
     
     # Check if all characters from query appear in order in text
-    query_idx = 0
-    for char in text:
-        if query_idx < len(query) and char == query[query_idx]:
-            query_idx += 1
-    
-    if query_idx == len(query):
+    # (each `in` resumes the iterator where the previous char was found)
+    chars = iter(text)
+    if all(c in chars for c in query):
         # All characters found in order
         return 60
     
@@ -67,9 +73,10 @@ def fuzzy_search(
         # Empty query - return all with max score
         return [(100, item) for item in items]
     
+    q = query.lower()
     results = []
     for item in items:
-        score = simple_fuzzy_score(query, item.filename)
+        score = _score(q, item.name_lower)
         if score >= threshold:
             results.append((score, item))
     
@@ -79,6 +86,328 @@ def fuzzy_search(
     return results
 
 
+def _subsequence_regex(query: str) -> "re.Pattern[str]":
+    """Compile a regex matching text that contains ``query``'s characters in order.
+
+    ``[^c]*c`` steps to the next occurrence of each character, so the
+    anchored match never backtracks more than linearly.
+    """
+    return re.compile("".join(f"[^{re.escape(c)}]*{re.escape(c)}" for c in query))
+
+
+class SearchIndex:
+    """Inverted character index over lowercased torrent names.
+
+    Scores of 60 and above require every query character to occur in the
+    name (in order), so candidates are the intersection of per-character
+    bitmaps; only they are scored. Maintained incrementally through
+    ``add``/``remove`` (TorrentLibrary calls them on every change).
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._slots: Dict[str, int] = {}
+        self._rows: List[Optional[TorrentRow]] = []
+        self._free: List[int] = []
+        # char -> bitmap of slots whose name contains it
+        self._bitmaps: Dict[str, bytearray] = {}
+        self._capacity = 0  # bytes per bitmap
+        # Bumped on every change so cached results can be invalidated
+        self.version = 0
+
+    def __len__(self) -> int:
+        """Get the number of indexed rows."""
+        return len(self._slots)
+
+    def add(self, row: TorrentRow) -> None:
+        """Index a new row or replace the indexed version of a row.
+
+        Args:
+            row: Row to index
+        """
+        slot = self._slots.get(row.id)
+        if slot is not None:
+            old = self._rows[slot]
+            if old is not None and old.name_lower == row.name_lower:
+                self._rows[slot] = row
+                self.version += 1
+                return
+            self.remove(row.id)
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._rows)
+            self._rows.append(None)
+            if slot >> 3 >= self._capacity:
+                self._grow()
+        self._slots[row.id] = slot
+        self._rows[slot] = row
+        self.version += 1
+        byte, bit = slot >> 3, 1 << (slot & 7)
+        for ch in set(row.name_lower):
+            bitmap = self._bitmaps.get(ch)
+            if bitmap is None:
+                bitmap = self._bitmaps[ch] = bytearray(self._capacity)
+            bitmap[byte] |= bit
+
+    def remove(self, tid: str) -> None:
+        """Drop a row from the index (no-op if unknown).
+
+        Args:
+            tid: Torrent ID
+        """
+        slot = self._slots.pop(tid, None)
+        if slot is None:
+            return
+        row = self._rows[slot]
+        self._rows[slot] = None
+        self._free.append(slot)
+        self.version += 1
+        if row is None:
+            return
+        byte, mask = slot >> 3, ~(1 << (slot & 7)) & 0xFF
+        for ch in set(row.name_lower):
+            self._bitmaps[ch][byte] &= mask
+
+    def _grow(self) -> None:
+        """Double the bitmap capacity."""
+        extra = max(64, self._capacity)
+        self._capacity += extra
+        for bitmap in self._bitmaps.values():
+            bitmap.extend(bytes(extra))
+
+    def _mask(self, query: str) -> int:
+        """Get the bitmap of slots containing every character of ``query`` (-1: all)."""
+        mask = -1
+        for ch in set(query):
+            bitmap = self._bitmaps.get(ch)
+            if bitmap is None:
+                return 0
+            mask &= int.from_bytes(bitmap, "little")
+            if not mask:
+                return 0
+        return mask
+
+    def count_candidates(self, query: str) -> int:
+        """Get the number of rows ``candidates`` would return, without building them.
+
+        Args:
+            query: Lowercased query
+        """
+        mask = self._mask(query)
+        return len(self) if mask == -1 else bin(mask).count("1")
+
+    def candidates(self, query: str) -> List[TorrentRow]:
+        """Get rows whose name contains every character of a lowercased query.
+
+        Args:
+            query: Lowercased query
+        """
+        mask = self._mask(query)
+        if not mask:
+            return []
+        if mask == -1:
+            return [row for row in self._rows if row is not None]
+
+        out: List[TorrentRow] = []
+        rows = self._rows
+        data = mask.to_bytes(self._capacity, "little")
+        for byte_index, byte in enumerate(data):
+            if not byte:
+                continue
+            base = byte_index << 3
+            for bit in range(8):
+                if byte >> bit & 1:
+                    row = rows[base + bit]
+                    if row is not None:
+                        out.append(row)
+        return out
+
+    def search(self, query: str, threshold: int = 40) -> List[Tuple[int, TorrentRow]]:
+        """Search indexed rows; same results and ranking as fuzzy_search.
+
+        Args:
+            query: Search query string
+            threshold: Minimum score to include (0-100)
+
+        Returns:
+            List of (score, item) tuples, sorted by score descending
+        """
+        results = self.score(query, threshold)
+        results.sort(reverse=True, key=lambda x: x[0])
+        return results
+
+    def score(
+        self,
+        query: str,
+        threshold: int = 40,
+        pool: Optional[Sequence[TorrentRow]] = None,
+    ) -> List[Tuple[int, TorrentRow]]:
+        """Score rows against a query, unsorted.
+
+        Args:
+            query: Search query string
+            threshold: Minimum score to include (0-100)
+            pool: Rows known to contain all matches; candidates from the
+                index if None
+        """
+        if not query.strip():
+            return [(100, row) for row in self._rows if row is not None]
+        q = query.lower()
+        if threshold <= PARTIAL_SCORE:
+            rows = pool if pool is not None else [r for r in self._rows if r is not None]
+            results = []
+            for row in rows:
+                score = _score(q, row.name_lower)
+                if score >= threshold:
+                    results.append((score, row))
+            return results
+
+        # Same tiers as _score down to 60, with the in-order check done by
+        # one anchored regex instead of a Python loop
+        in_order = _subsequence_regex(q).match
+        results = []
+        for row in pool if pool is not None else self.candidates(q):
+            text = row.name_lower
+            if q == text:
+                score = 100
+            elif q in text:
+                score = 95 if text.startswith(q) else 80
+            elif in_order(text):
+                score = 60
+            else:
+                continue
+            if score >= threshold:
+                results.append((score, row))
+        return results
+
+
+class SearchSession:
+    """Successive searches over a SearchIndex, narrowed keystroke by keystroke.
+
+    When a query extends the previous one, every new match (score 60+)
+    already matched the previous query, so only the previous matches are
+    scored again.
+    """
+
+    def __init__(self, index: SearchIndex, threshold: int = 50):
+        """Initialize the session.
+
+        Args:
+            index: Index to search
+            threshold: Minimum score to include (0-100)
+        """
+        self.index = index
+        self.threshold = threshold
+        self._query: Optional[str] = None
+        self._version = -1
+        self._results: List[Tuple[int, TorrentRow]] = []
+
+    def search(self, query: str) -> List[Tuple[int, TorrentRow]]:
+        """Get (score, row) matches for a query, unsorted.
+
+        Args:
+            query: Search query string
+        """
+        q = query.lower()
+        # Read before scoring: a change made meanwhile (e.g. from another
+        # thread) must invalidate these results
+        version = self.index.version
+        pool: Optional[List[TorrentRow]] = None
+        if (
+            self._query
+            and q.startswith(self._query)
+            and self._version == version
+            and self.threshold > PARTIAL_SCORE
+        ):
+            if q == self._query:
+                return self._results
+            # Narrow from the previous matches unless the index has fewer
+            if len(self._results) <= self.index.count_candidates(q):
+                pool = [row for _, row in self._results]
+        self._results = self.index.score(q, self.threshold, pool)
+        self._query = q
+        self._version = version
+        return self._results
+
+
+class LazyRanking(Sequence[str]):
+    """Row IDs ordered by a key, sorted only as far as they are read.
+
+    The first ``k`` IDs are picked with a heap (O(n log k)); the remaining
+    rows are sorted only when something past them is requested, e.g. when
+    a virtual table scrolls beyond the first screen.
+    """
+
+    def __init__(
+        self,
+        rows: Sequence[TorrentRow],
+        key: Callable[[TorrentRow], Any],
+        k: int,
+        reverse: bool = True,
+    ):
+        """Select the first ``k`` rows.
+
+        Args:
+            rows: Rows to rank
+            key: Sort key
+            k: Number of rows to rank up front
+            reverse: Largest key first
+        """
+        self._rows = rows
+        self._key = key
+        self._reverse = reverse
+        self._by_id = {row.id: row for row in rows}
+        pick = heapq.nlargest if reverse else heapq.nsmallest
+        self._prefix = [row.id for row in pick(k, rows, key=key)]
+        self._full: Optional[List[str]] = self._prefix if k >= len(rows) else None
+
+    def _all(self) -> List[str]:
+        """Get all IDs in order, sorting the rest on first use."""
+        if self._full is None:
+            # nlargest/nsmallest match sorted(), so the prefix stays valid
+            ordered = sorted(self._rows, key=self._key, reverse=self._reverse)
+            self._full = [row.id for row in ordered]
+            self._prefix = self._full
+        return self._full
+
+    def get(self, tid: str) -> TorrentRow:
+        """Get a ranked row by ID."""
+        return self._by_id[tid]
+
+    def __len__(self) -> int:
+        """Get the number of ranked rows."""
+        return len(self._by_id)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        """Get an ID or a slice of IDs by position."""
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step == 1 and stop <= len(self._prefix):
+                return self._prefix[start:stop]
+            return self._all()[i]
+        if 0 <= i < len(self._prefix):
+            return self._prefix[i]
+        return self._all()[i]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all IDs in order."""
+        return iter(self._all())
+
+    def __contains__(self, tid: object) -> bool:
+        """Check whether an ID is ranked."""
+        return tid in self._by_id
+
+    def index(self, tid: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """Get the position of an ID (sorts the rest only if needed)."""
+        if tid not in self._by_id:
+            raise ValueError(f"{tid!r} is not ranked")
+        try:
+            return self._prefix.index(tid, start, len(self._prefix) if stop is None else stop)
+        except ValueError:
+            return self._all().index(tid, start, len(self) if stop is None else stop)
+
+
 def highlight_match(query: str, text: str, max_length: int = 50) -> str:
     """
     Highlight matching parts of text (for display).
@@ -0,0 +1,260 @@
+"""Tests for the aria2 RPC client against fake HTTP and WebSocket servers."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from rdtui.api import Aria2RPC, aria2
+
+
+def item(prefix, status, i):
+    return {"gid": f"{prefix}{i:03d}", "status": status, "totalLength": "100"}
+
+
+class FakeAria:
+    """Answers JSON-RPC calls, including system.multicall, from in-memory lists."""
+
+    def __init__(self, active=2, waiting=30, stopped=20):
+        self.active = [item("a", "active", i) for i in range(active)]
+        self.waiting = [item("w", "waiting", i) for i in range(waiting)]
+        self.stopped = [item("s", "complete", i) for i in range(stopped)]
+        self.requests = []
+        self.fail = set()
+
+    def call(self, method, params):
+        if method in self.fail:
+            raise RuntimeError(method)
+        if method == "aria2.getGlobalStat":
+            return {
+                "numActive": str(len(self.active)),
+                "numWaiting": str(len(self.waiting)),
+                "numStopped": str(len(self.stopped)),
+                "downloadSpeed": "1234",
+            }
+        if method == "aria2.tellActive":
+            return self.active
+        if method == "aria2.tellWaiting":
+            return self.waiting[params[0] : params[0] + params[1]]
+        if method == "aria2.tellStopped":
+            return self.stopped[params[0] : params[0] + params[1]]
+        if method == "aria2.addUri":
+            return f"g{len(self.requests)}"
+        raise RuntimeError(method)
+
+    def handler(self, request):
+        body = json.loads(request.content)
+        self.requests.append(body)
+        if body["method"] == "system.multicall":
+            result = []
+            for sub in body["params"][0]:
+                assert sub["params"][0] == "token:secret"
+                try:
+                    result.append([self.call(sub["methodName"], sub["params"][1:])])
+                except RuntimeError as e:
+                    result.append({"faultCode": 1, "faultString": str(e)})
+            return httpx.Response(200, json={"id": body["id"], "result": result})
+        assert body["params"][0] == "token:secret"
+        result = self.call(body["method"], body["params"][1:])
+        return httpx.Response(200, json={"id": body["id"], "result": result})
+
+
+def make_rpc(fake):
+    rpc = Aria2RPC("http://aria2.invalid/jsonrpc", "secret")
+    rpc._client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))
+    return rpc
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_multicall_is_one_request_with_per_call_results():
+    fake = FakeAria()
+    fake.fail.add("aria2.tellStopped")
+
+    async def go():
+        rpc = make_rpc(fake)
+        try:
+            calls = [
+                ("aria2.tellActive", []),
+                ("aria2.tellStopped", [0, 5]),
+                ("aria2.tellWaiting", [0, 2]),
+            ]
+            return await rpc.multicall(calls)
+        finally:
+            await rpc.close()
+
+    active, stopped, waiting = run(go())
+    assert len(fake.requests) == 1
+    assert fake.requests[0]["params"][0][0]["methodName"] == "aria2.tellActive"
+    assert active == fake.active
+    assert isinstance(stopped, RuntimeError)
+    assert waiting == fake.waiting[:2]
+
+
+class FakeSocket:
+    """WebSocket stand-in; answers calls only while ``answer`` is set."""
+
+    def __init__(self, answer=True):
+        self.answer = answer
+        self.sent = []
+        self.inbox = asyncio.Queue()
+
+    async def send(self, raw):
+        msg = json.loads(raw)
+        self.sent.append(msg)
+        if self.answer:
+            self.inbox.put_nowait(json.dumps({"id": msg["id"], "result": []}))
+
+    def push(self, msg):
+        self.inbox.put_nowait(json.dumps(msg))
+
+    def drop(self):
+        self.inbox.put_nowait(None)
+
+    async def close(self):
+        self.drop()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raw = await self.inbox.get()
+        if raw is None:
+            raise StopAsyncIteration
+        return raw
+
+
+def patch_connect(monkeypatch, sockets):
+    """Make websockets.connect hand out ``sockets`` in order."""
+    opened = []
+
+    async def connect(url, **kwargs):
+        ws = sockets[len(opened)]
+        opened.append(ws)
+        return ws
+
+    monkeypatch.setattr(aria2.websockets, "connect", connect)
+    monkeypatch.setattr(aria2, "WS_RECONNECT_MIN", 0.01)
+    return opened
+
+
+def test_ws_call_timeout_keeps_the_connection(monkeypatch):
+    ws = FakeSocket(answer=False)
+    patch_connect(monkeypatch, [ws])
+
+    async def go():
+        rpc = make_rpc(FakeAria())
+        rpc.timeout = 0.05
+        try:
+            assert await rpc.connect_ws()
+            with pytest.raises(asyncio.TimeoutError):
+                await rpc.tell_active()
+            ws.answer = True
+            assert await rpc.tell_active() == []
+            return rpc.ws_connected
+        finally:
+            await rpc.close()
+
+    assert run(go())
+    assert len(ws.sent) == 2
+
+
+def test_ws_reconnects_after_drop_and_keeps_notifying(monkeypatch):
+    first, second = FakeSocket(), FakeSocket()
+    opened = patch_connect(monkeypatch, [first, second])
+    events = []
+
+    async def go():
+        rpc = make_rpc(FakeAria())
+        try:
+            await rpc.connect_ws()
+            rpc.add_listener(lambda event, gid: events.append((event, gid)))
+            first.drop()
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if rpc.ws_connected and len(opened) == 2:
+                    break
+            second.push({"method": "aria2.onDownloadComplete", "params": [{"gid": "g1"}]})
+            await asyncio.sleep(0.01)
+        finally:
+            await rpc.close()
+        return rpc._reconnect_task
+
+    assert run(go()) is None
+    assert opened == [first, second]
+    assert events == [("onDownloadComplete", "g1")]
+
+
+def window(fake, offset, num, counts=None, retry=True):
+    async def go():
+        rpc = make_rpc(fake)
+        try:
+            return await rpc.tell_window(offset, num, counts, retry=retry)
+        finally:
+            await rpc.close()
+
+    return run(go())
+
+
+def test_tell_window_spans_the_lists_in_queue_order():
+    fake = FakeAria(active=2, waiting=30, stopped=20)
+    _, counts = window(fake, 0, 1)
+    assert counts["numWaiting"] == 30
+
+    fake.requests.clear()
+    items, counts = window(fake, 25, 10, counts)
+    assert [i["gid"] for i in items] == [f"w{i:03d}" for i in range(23, 30)] + [
+        "s000",
+        "s001",
+        "s002",
+    ]
+    assert counts == {"numActive": 2, "numWaiting": 30, "numStopped": 20, "downloadSpeed": 1234}
+    assert len(fake.requests) == 1
+    calls = fake.requests[0]["params"][0]
+    assert [c["methodName"] for c in calls] == [
+        "aria2.getGlobalStat",
+        "aria2.tellActive",
+        "aria2.tellWaiting",
+        "aria2.tellStopped",
+    ]
+    assert calls[2]["params"][1:3] == [23, 7]
+    assert calls[3]["params"][1:3] == [0, 3]
+
+
+def test_tell_window_skips_lists_outside_the_window():
+    fake = FakeAria(active=2, waiting=30, stopped=20)
+    counts = {"numActive": 2, "numWaiting": 30, "numStopped": 20}
+    items, _ = window(fake, 0, 5, counts)
+    assert [i["gid"] for i in items] == ["a000", "a001", "w000", "w001", "w002"]
+    methods = [c["methodName"] for c in fake.requests[0]["params"][0]]
+    assert "aria2.tellStopped" not in methods
+
+    fake.requests.clear()
+    items, _ = window(fake, 40, 5, counts)
+    assert [i["gid"] for i in items] == [f"s{i:03d}" for i in range(8, 13)]
+    methods = [c["methodName"] for c in fake.requests[0]["params"][0]]
+    assert "aria2.tellWaiting" not in methods
+
+
+def test_tell_window_raises_failed_listing():
+    fake = FakeAria()
+    fake.fail.add("aria2.tellWaiting")
+    with pytest.raises(RuntimeError):
+        window(fake, 0, 10, {"numActive": 2, "numWaiting": 30})
+
+
+def test_tell_window_without_retry_fails_on_first_error():
+    fake = FakeAria()
+    served = []
+
+    def unavailable(request):
+        served.append(request)
+        return httpx.Response(503)
+
+    fake.handler = unavailable
+    with pytest.raises(httpx.HTTPStatusError):
+        window(fake, 0, 10, retry=False)
+    assert len(served) == 1
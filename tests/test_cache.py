@@ -0,0 +1,90 @@
+"""Tests for the on-disk unrestrict cache."""
+
+import asyncio
+import json
+
+import pytest
+
+from rdtui.api import UnrestrictCache, token_scoped_path
+from rdtui.api import cache as cache_module
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+def result(name):
+    return {"download": f"https://dl/{name}", "filename": name, "filesize": 1, "extra": "x"}
+
+
+def test_get_returns_cached_fields_until_expiry(tmp_path, clock):
+    cache = UnrestrictCache(tmp_path / "c.json", ttl=60)
+    cache.put("a", result("a"))
+    assert cache.get("a") == {"download": "https://dl/a", "filename": "a", "filesize": 1}
+    clock[0] += 61
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_put_without_download_is_ignored(tmp_path, clock):
+    cache = UnrestrictCache(tmp_path / "c.json")
+    cache.put("a", {"filename": "a"})
+    assert cache.get("a") is None
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path, clock):
+    cache = UnrestrictCache(tmp_path / "c.json", max_entries=2)
+    cache.put("a", result("a"))
+    cache.put("b", result("b"))
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", result("c"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_flush_and_reload_drops_expired(tmp_path, clock):
+    path = tmp_path / "c.json"
+    cache = UnrestrictCache(path, ttl=60)
+    cache.put("a", result("a"))  # no running loop: written at once
+    clock[0] += 30
+    cache.put("b", result("b"))
+    assert set(json.loads(path.read_text())) == {"a", "b"}
+
+    clock[0] += 45  # "a" expired, "b" still valid
+    reloaded = UnrestrictCache(path, ttl=60)
+    assert reloaded.get("a") is None
+    assert reloaded.get("b") is not None
+
+
+def test_writes_are_coalesced_inside_the_loop(tmp_path, clock):
+    path = tmp_path / "c.json"
+
+    async def burst():
+        cache = UnrestrictCache(path)
+        for name in "abc":
+            cache.put(name, result(name))
+        assert not path.exists()
+        cache.flush()
+        return cache
+
+    cache = asyncio.run(burst())
+    assert set(json.loads(path.read_text())) == {"a", "b", "c"}
+    assert cache._flush_handle is None
+
+
+@pytest.mark.parametrize("content", ["[]", "null", "42", "not json", ""])
+def test_unexpected_file_content_starts_empty(tmp_path, content):
+    path = tmp_path / "c.json"
+    path.write_text(content)
+    assert len(UnrestrictCache(path)) == 0
+
+
+def test_cache_file_is_scoped_by_token(tmp_path):
+    first = token_scoped_path(tmp_path, "token-1")
+    assert first == token_scoped_path(tmp_path, "token-1")
+    assert first != token_scoped_path(tmp_path, "token-2")
+    assert first.parent == tmp_path and "token-1" not in first.name
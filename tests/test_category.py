@@ -0,0 +1,62 @@
+"""Tests for torrent categorization."""
+
+import pytest
+
+from rdtui.models import TorrentRow
+from rdtui.models.category import (
+    CATEGORY_GAMES,
+    CATEGORY_MOVIES,
+    CATEGORY_RULES,
+    CATEGORY_SERIES,
+    CategoryMatcher,
+    categorize,
+    set_category_matcher,
+)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("show.s01e02.1080p.mkv", CATEGORY_SERIES),
+        ("show season 2 complete", CATEGORY_SERIES),
+        ("show.s1e5", CATEGORY_SERIES),
+        ("movie.2020.1080p.mkv", CATEGORY_MOVIES),
+        ("clip.webm", CATEGORY_MOVIES),
+        ("movie.mkv.part", CATEGORY_GAMES),
+        ("some.game-group", CATEGORY_GAMES),
+        ("", CATEGORY_GAMES),
+        ("multi\nline.mp4", CATEGORY_MOVIES),
+    ],
+)
+def test_default_rules(name, expected):
+    assert categorize(name) == expected
+
+
+def test_first_matching_rule_wins():
+    matcher = CategoryMatcher([("a", "x"), ("b", "x|y")], default="c")
+    assert matcher.classify("..x..") == "a"
+    assert matcher.classify("..y..") == "b"
+    assert matcher.classify("..z..") == "c"
+
+
+def test_matcher_without_rules_uses_default():
+    assert CategoryMatcher([], default="c").classify("anything") == "c"
+
+
+def test_set_category_matcher_applies_to_new_rows():
+    row = TorrentRow("1", "Movie.mkv", "downloaded", 100, None, 1)
+    assert row.category == CATEGORY_MOVIES
+    try:
+        set_category_matcher(CategoryMatcher([], default=CATEGORY_SERIES))
+        assert TorrentRow("2", "Movie.mkv", "downloaded", 100, None, 1).category == CATEGORY_SERIES
+    finally:
+        set_category_matcher(CategoryMatcher(CATEGORY_RULES))
+    assert row.category == CATEGORY_MOVIES
+
+
+def test_row_derives_fields_and_caches_rendered_size():
+    row = TorrentRow("1", "Show.S01E01.mkv", "downloaded", 100, None, 1536)
+    assert row.name_lower == "show.s01e01.mkv"
+    assert row.category == CATEGORY_SERIES
+    assert row.pretty_size() == "1.5K"
+    assert row.pretty_size() is row.pretty_size()
@@ -0,0 +1,127 @@
+"""Tests for the torrent library and the incremental (delta) sync."""
+
+import asyncio
+import threading
+
+from rdtui.app import RDTUI
+from rdtui.models import LibraryDelta, TorrentLibrary, TorrentRow
+
+
+def info(i, status="downloaded", progress=100):
+    """Build an API torrent dict; a higher ``i`` is newer."""
+    return {
+        "id": f"T{i}",
+        "filename": f"Game {i}",
+        "bytes": i,
+        "progress": progress,
+        "status": status,
+        "added": f"2024-01-01T{i // 3600:02d}:{i % 3600 // 60:02d}:{i % 60:02d}.000Z",
+    }
+
+
+def newest_first(infos):
+    return sorted(infos, key=lambda t: t["added"], reverse=True)
+
+
+def test_upsert_reports_inserted_and_updated():
+    library = TorrentLibrary()
+    delta = library.upsert([TorrentRow.from_info(info(1)), TorrentRow.from_info(info(2))])
+    assert delta.inserted == ["T1", "T2"] and not delta.updated
+
+    changed = TorrentRow.from_info(info(2, "downloading", 5))
+    delta = library.upsert([TorrentRow.from_info(info(1)), changed])
+    assert delta.updated == ["T2"] and not delta.inserted
+    assert not library.upsert([TorrentRow.from_info(info(1))])
+
+
+def test_merge_window_deletes_only_inside_the_window():
+    library = TorrentLibrary()
+    library.upsert([TorrentRow.from_info(info(i)) for i in range(10)])
+    # Window covers T9..T5 and T7 is gone; T0..T4 were simply not fetched
+    window = [TorrentRow.from_info(info(i)) for i in (9, 8, 6, 5)]
+    delta = library.merge_window(window, reached_end=False)
+    assert delta.deleted == ["T7"]
+    assert library.ids() == {f"T{i}" for i in range(10)} - {"T7"}
+
+    delta = library.merge_window(window, reached_end=True)
+    assert sorted(delta.deleted) == [f"T{i}" for i in range(5)]
+    assert library.ids() == {"T9", "T8", "T6", "T5"}
+
+
+class LockCheckingIndex:
+    """Index that records whether the library held its lock on each update."""
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.calls = []
+
+    def add(self, row):
+        self.calls.append(("add", row.id, self.lock.locked()))
+
+    def remove(self, tid):
+        self.calls.append(("remove", tid, self.lock.locked()))
+
+
+def test_index_updates_hold_the_index_lock():
+    lock = threading.Lock()
+    index = LockCheckingIndex(lock)
+    library = TorrentLibrary(index=index, index_lock=lock)
+    library.upsert([TorrentRow.from_info(info(i)) for i in range(3)])
+    library.merge_window([TorrentRow.from_info(info(2, "downloading", 5))], reached_end=True)
+    assert index.calls == [
+        ("add", "T0", True),
+        ("add", "T1", True),
+        ("add", "T2", True),
+        ("add", "T2", True),
+        ("remove", "T0", True),
+        ("remove", "T1", True),
+    ]
+    assert not lock.locked()
+
+
+def test_library_delta_merge():
+    delta = LibraryDelta(inserted=["a"])
+    delta.extend(LibraryDelta(updated=["b"], deleted=["c"]))
+    assert delta and (delta.inserted, delta.updated, delta.deleted) == (["a"], ["b"], ["c"])
+    assert not LibraryDelta()
+
+
+class FakeRD:
+    """Serves a newest-first torrent list page by page."""
+
+    def __init__(self, infos):
+        self.infos = newest_first(infos)
+        self.pages = []
+
+    async def torrents_page(self, offset=0, limit=100):
+        self.pages.append(offset)
+        return self.infos[offset : offset + limit], len(self.infos)
+
+
+def make_app(infos, server_infos):
+    app = RDTUI()
+    app.cfg = {"delta_sync_page_size": 10, "delta_sync_stop_after": 5}
+    app.library.upsert(TorrentRow.from_info(t) for t in infos)
+    app.rd = FakeRD(server_infos)  # type: ignore[assignment]
+    return app
+
+
+def test_delta_sync_stops_after_unchanged_settled_rows():
+    infos = [info(i) for i in range(100)]
+    app = make_app(infos, infos + [info(100)])
+    delta = asyncio.run(app._delta_sync())
+    assert delta.inserted == ["T100"]
+    assert app.rd.pages == [0]
+
+
+def test_delta_sync_rechecks_old_downloads_in_progress():
+    infos = [info(i) for i in range(100)]
+    infos[20] = info(20, "downloading", 10)
+    server = list(infos)
+    server[20] = info(20, "downloading", 60)
+    app = make_app(infos, server)
+    delta = asyncio.run(app._delta_sync())
+    assert delta.updated == ["T20"]
+    assert app.library.get("T20").progress == 60
+    # Scanned past T20 (80th newest) until 5 unchanged rows, not the whole list
+    assert app.rd.pages == list(range(0, 90, 10))
@@ -0,0 +1,53 @@
+"""Tests for pasted link classification."""
+
+import pytest
+
+from rdtui.ui import QuickPasteModal
+from rdtui.utils import detect_link_type, parse_links
+
+MAGNET = "magnet:?xt=urn:btih:abcdef"
+
+
+@pytest.mark.parametrize(
+    "link, expected",
+    [
+        (MAGNET, "magnet"),
+        ("https://example.com/file.torrent", "torrent_url"),
+        ("https://example.com/file.TORRENT?token=1", "torrent_url"),
+        ("https://1fichier.com/?abc", "hoster_or_direct"),
+        ("  https://example.com/a.mkv  ", "hoster_or_direct"),
+        ("ftp://example.com/a", "unknown"),
+        ("see", "unknown"),
+    ],
+)
+def test_detect_link_type(link, expected):
+    assert detect_link_type(link) == expected
+
+
+def test_parse_links_splits_on_any_whitespace_and_deduplicates():
+    text = f"{MAGNET}\n\nhttps://h/a https://h/a\r\n\thttps://x/b.torrent {MAGNET}"
+    assert parse_links(text) == [
+        (MAGNET, "magnet"),
+        ("https://h/a", "hoster_or_direct"),
+        ("https://x/b.torrent", "torrent_url"),
+    ]
+
+
+def test_parse_links_keeps_unknown_tokens():
+    assert parse_links("see " + MAGNET) == [("see", "unknown"), (MAGNET, "magnet")]
+    assert parse_links("   ") == []
+
+
+@pytest.mark.parametrize(
+    "content, link_type, links",
+    [
+        ("see " + MAGNET, "magnet", [MAGNET]),
+        (MAGNET + " trailing text", "magnet", [MAGNET]),
+        (f"{MAGNET}\nhttps://h/a", "multiple", [MAGNET, "https://h/a"]),
+        ("no links here", "unknown", []),
+    ],
+)
+def test_quick_paste_preview_matches_imported_links(content, link_type, links):
+    modal = QuickPasteModal(content)
+    assert modal.link_type == link_type
+    assert [link for link, _ in modal.links] == links
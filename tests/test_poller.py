@@ -0,0 +1,122 @@
+"""Tests for the adaptive queue poll scheduler."""
+
+import asyncio
+
+from rdtui.ui import QueuePoller
+from rdtui.ui.poller import MIN_DELAY
+
+
+class FakeTimer:
+    def __init__(self, delay, callback):
+        self.delay = delay
+        self.callback = callback
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+class FakeOwner:
+    """Records timers instead of running them; fire() runs the pending one."""
+
+    def __init__(self):
+        self.timers = []
+
+    def set_timer(self, delay, callback, name=None):
+        self.timers.append(FakeTimer(delay, callback))
+        return self.timers[-1]
+
+    @property
+    def pending(self):
+        live = [t for t in self.timers if not t.stopped]
+        return live[-1] if live else None
+
+    def fire(self):
+        timer = self.pending
+        timer.stopped = True
+        asyncio.run(timer.callback())
+        return timer.delay
+
+
+def make_poller(results, fast=2.0, idle=30.0):
+    """Poller whose polls report ``results`` in turn (busy=True/False)."""
+    owner = FakeOwner()
+    polls = []
+
+    async def poll():
+        polls.append(1)
+        result = results[len(polls) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    poller = QueuePoller(owner, poll, lambda: fast, idle_interval=idle)
+    return poller, owner, polls
+
+
+def test_start_polls_once_right_away():
+    poller, owner, polls = make_poller([True])
+    poller.start()
+    poller.start()  # no-op while running
+    assert len(owner.timers) == 1
+    assert owner.fire() == MIN_DELAY
+    assert polls == [1]
+    assert owner.pending.delay == 2.0
+
+
+def test_idle_polls_back_off_up_to_the_idle_interval():
+    poller, owner, _ = make_poller([False] * 6 + [True])
+    poller.start()
+    delays = [owner.fire() for _ in range(7)]
+    assert delays == [MIN_DELAY, 4.0, 8.0, 16.0, 30.0, 30.0, 30.0]
+    # A busy poll returns to the fast cadence
+    assert owner.pending.delay == 2.0
+
+
+def test_failed_poll_counts_as_idle():
+    poller, owner, _ = make_poller([RuntimeError("down")])
+    poller.start()
+    owner.fire()
+    assert poller.running
+    assert owner.pending.delay == 4.0
+
+
+def test_poke_resets_the_cadence_and_polls_soon():
+    poller, owner, _ = make_poller([False, False, False])
+    poller.start()
+    owner.fire()
+    owner.fire()
+    assert poller.interval == 8.0
+    poller.poke()
+    assert poller.interval == 2.0
+    assert owner.pending.delay == MIN_DELAY
+    assert sum(not t.stopped for t in owner.timers) == 1
+
+
+def test_poke_during_poll_is_coalesced_into_one_follow_up():
+    owner = FakeOwner()
+    polls = []
+
+    async def poll():
+        polls.append(1)
+        poller.poke()
+        poller.poke()
+        return False
+
+    poller = QueuePoller(owner, poll, lambda: 2.0)
+    poller.start()
+    owner.fire()
+    assert owner.pending.delay == MIN_DELAY
+    assert sum(not t.stopped for t in owner.timers) == 1
+
+
+def test_stop_cancels_the_timer_and_ignores_pokes():
+    poller, owner, polls = make_poller([True])
+    poller.start()
+    timer = owner.pending
+    poller.stop()
+    assert timer.stopped and owner.pending is None
+    poller.poke()
+    assert owner.pending is None
+    asyncio.run(timer.callback())  # a tick already in flight does nothing
+    assert polls == []
@@ -0,0 +1,77 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from rdtui.api import TokenBucket, ratelimit
+from rdtui.api.ratelimit import retry_after_seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; asyncio.sleep advances it instead of waiting."""
+    now = [100.0]
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", sleep)
+    return now, sleeps
+
+
+def test_burst_then_sustained_rate(clock):
+    now, sleeps = clock
+    bucket = TokenBucket(rate_per_minute=60, burst=3)
+
+    async def run():
+        for _ in range(5):
+            await bucket.acquire()
+
+    asyncio.run(run())
+    # Three requests go out at once, then one per second
+    assert sleeps == pytest.approx([1.0, 1.0])
+    assert now[0] == pytest.approx(102.0)
+    assert bucket.tokens == 0
+
+
+def test_tokens_refill_up_to_capacity(clock):
+    now, _ = clock
+    bucket = TokenBucket(rate_per_minute=60, burst=5)
+    asyncio.run(bucket.acquire())
+    assert bucket.tokens == 4
+    now[0] += 60
+    assert bucket.tokens == 5
+
+
+def test_penalize_blocks_until_retry_after(clock):
+    now, sleeps = clock
+    bucket = TokenBucket(rate_per_minute=600, burst=10)
+    bucket.penalize(7.5)
+    assert bucket.tokens == 0
+    assert bucket.blocked_for == pytest.approx(7.5)
+    asyncio.run(bucket.acquire())
+    assert now[0] >= 107.5
+    assert bucket.status()["waiting"] == 0
+
+
+def response(headers):
+    return httpx.Response(429, headers=headers)
+
+
+def test_retry_after_seconds_parses_both_forms():
+    assert retry_after_seconds(response({"Retry-After": "12"})) == 12.0
+    assert retry_after_seconds(response({"Retry-After": "-3"})) == 0.0
+    date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= retry_after_seconds(response({"Retry-After": date})) <= 30
+
+
+def test_retry_after_seconds_default():
+    assert retry_after_seconds(response({}), default=4.0) == 4.0
+    assert retry_after_seconds(response({"Retry-After": "soon"}), default=4.0) == 4.0
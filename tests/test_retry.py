@@ -0,0 +1,86 @@
+"""Tests for the retry policy."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from rdtui.api import RetryPolicy
+from rdtui.api import retry as retry_module
+from rdtui.api.retry import with_retry
+
+REQUEST = httpx.Request("GET", "https://example.invalid/")
+
+
+def status_error(code):
+    response = httpx.Response(code, request=REQUEST)
+    return httpx.HTTPStatusError("error", request=REQUEST, response=response)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Record backoff pauses instead of waiting."""
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(retry_module.asyncio, "sleep", sleep)
+    return sleeps
+
+
+@pytest.mark.parametrize(
+    "exc, idempotent, expected",
+    [
+        (httpx.ConnectError("refused"), False, True),
+        (httpx.ConnectTimeout("timeout"), False, True),
+        (httpx.ReadTimeout("timeout"), False, False),
+        (httpx.ReadTimeout("timeout"), True, True),
+        (httpx.RemoteProtocolError("reset"), True, True),
+        (status_error(503), True, True),
+        (status_error(503), False, False),
+        (status_error(404), True, False),
+        (ValueError("bug"), True, False),
+    ],
+)
+def test_should_retry(exc, idempotent, expected):
+    assert RetryPolicy().should_retry(exc, idempotent) is expected
+
+
+def test_delay_grows_exponentially_with_jitter_and_cap():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0, jitter=0.5)
+    for attempt, base in [(1, 0.5), (2, 1.0), (3, 2.0), (4, 3.0), (10, 3.0)]:
+        for _ in range(20):
+            assert base * 0.5 <= policy.delay(attempt) <= base
+
+
+def run_calls(failures, policy, idempotent):
+    """Run with_retry over a call failing with ``failures`` before succeeding."""
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return "ok"
+
+    return asyncio.run(with_retry(call, policy, idempotent)), len(calls)
+
+
+def test_with_retry_recovers_from_transient_failures(no_sleep):
+    failures = [httpx.ReadTimeout("t"), status_error(502)]
+    assert run_calls(failures, RetryPolicy(jitter=0), True) == ("ok", 3)
+    assert no_sleep == [0.5, 1.0]
+
+
+def test_with_retry_gives_up_after_max_attempts():
+    failures = [httpx.ReadTimeout("t")] * 5
+    with pytest.raises(httpx.ReadTimeout):
+        run_calls(failures, RetryPolicy(max_attempts=3), True)
+
+
+def test_non_idempotent_calls_are_not_repeated_after_sending():
+    with pytest.raises(httpx.ReadTimeout):
+        run_calls([httpx.ReadTimeout("t")], RetryPolicy(), False)
+    # ...but are when the request never left the client
+    assert run_calls([httpx.ConnectError("refused")], RetryPolicy(), False) == ("ok", 2)
@@ -0,0 +1,68 @@
+"""Checks that the indexed search paths agree with fuzzy_search."""
+
+import random
+
+import pytest
+
+from rdtui.models import TorrentRow
+from rdtui.utils import SearchIndex, fuzzy_search
+
+WORDS = ["Show", "Movie", "Game", "S01E02", "1080p", "WEB-DL", "x264", "Repack", "ĄŻółć"]
+QUERIES = ["", "s", "sh", "sho", "show", "show s01", "mv", "game repack", "1080", "zz", "ół", "x"]
+
+
+def make_rows(n, seed=0):
+    """Build rows with random names and dates (some undated)."""
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n):
+        name = ".".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 5)))
+        added = None
+        if i % 17:
+            added = f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T{i % 24:02d}:00:00.000Z"
+        info = {"id": f"T{i}", "filename": name, "bytes": i, "status": "downloaded", "added": added}
+        rows.append(TorrentRow.from_info(info))
+    return rows
+
+
+def normalized(results):
+    """Compare results regardless of the order of equal scores."""
+    return sorted((-score, row.id) for score, row in results)
+
+
+@pytest.mark.parametrize("threshold", [0, 40, 50, 60, 80])
+@pytest.mark.parametrize("query", QUERIES)
+def test_index_matches_fuzzy_search(query, threshold):
+    rows = make_rows(500)
+    index = SearchIndex()
+    for row in rows:
+        index.add(row)
+    results = index.search(query, threshold)
+    assert normalized(results) == normalized(fuzzy_search(query, rows, threshold))
+    scores = [score for score, _ in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_index_after_remove_and_readd():
+    rows = make_rows(500, seed=1)
+    index = SearchIndex()
+    for row in rows:
+        index.add(row)
+    removed = rows[::3]
+    for row in removed:
+        index.remove(row.id)
+    kept = [row for row in rows if row not in removed]
+    for query in QUERIES:
+        assert normalized(index.search(query, 50)) == normalized(fuzzy_search(query, kept, 50))
+
+    # Re-add some rows under new names; the slots are reused
+    renamed = [
+        TorrentRow.from_info({"id": row.id, "filename": row.filename + ".Show.mkv"})
+        for row in removed[:50]
+    ]
+    for row in renamed:
+        index.add(row)
+    current = kept + renamed
+    assert len(index) == len(current)
+    for query in QUERIES:
+        assert normalized(index.search(query, 50)) == normalized(fuzzy_search(query, current, 50))
@@ -0,0 +1,43 @@
+"""Checks that incremental search sessions and lazy rankings match full passes."""
+
+from operator import attrgetter
+
+import pytest
+from test_search import make_rows, normalized
+
+from rdtui.models import TorrentRow
+from rdtui.utils import LazyRanking, SearchIndex, SearchSession, fuzzy_search
+
+
+@pytest.mark.parametrize("threshold", [30, 50])
+def test_session_narrowing_matches_fuzzy_search(threshold):
+    rows = make_rows(500, seed=2)
+    index = SearchIndex()
+    for row in rows:
+        index.add(row)
+    session = SearchSession(index, threshold=threshold)
+    for query in ["s", "sh", "sho", "show", "sho", "show.s", "x", "x2", "x264"]:
+        expected = fuzzy_search(query, rows, threshold)
+        assert normalized(session.search(query)) == normalized(expected)
+
+    # An index change between keystrokes must not be hidden by the narrowing
+    extra = TorrentRow.from_info({"id": "NEW", "filename": "Show.x264.mkv"})
+    index.add(extra)
+    index.remove(rows[0].id)
+    current = rows[1:] + [extra]
+    for query in ["show", "show.x"]:
+        expected = fuzzy_search(query, current, threshold)
+        assert normalized(session.search(query)) == normalized(expected)
+
+
+@pytest.mark.parametrize("k", [0, 1, 10, 499, 1000])
+def test_lazy_ranking_order(k):
+    rows = make_rows(499, seed=3)
+    key = attrgetter("sort_key")
+    expected = [row.id for row in sorted(rows, key=key, reverse=True)]
+    ranking = LazyRanking(rows, key, k=k)
+    assert len(ranking) == len(expected)
+    assert ranking[: min(k, len(rows))] == expected[: min(k, len(rows))]
+    assert ranking[len(rows) // 2] == expected[len(rows) // 2]
+    assert list(ranking) == expected
+    assert ranking.index(expected[-1]) == len(expected) - 1
@@ -0,0 +1,56 @@
+"""Tests for the keyed, in-place updated table."""
+
+import asyncio
+
+from textual.app import App, ComposeResult
+
+from rdtui.ui.tables import KeyedTable
+
+
+class TableApp(App):
+    def compose(self) -> ComposeResult:
+        yield KeyedTable()
+
+
+def with_table(check):
+    """Run ``check(table)`` against a mounted KeyedTable with two columns."""
+
+    async def go():
+        app = TableApp()
+        async with app.run_test():
+            table = app.query_one(KeyedTable)
+            table.add_columns("name", "size")
+            check(table)
+
+    asyncio.run(go())
+
+
+def rows(keys, size=1):
+    return [(key, (key.upper(), size)) for key in keys]
+
+
+def displayed(table):
+    return [row.key.value for row in table.ordered_rows]
+
+
+def test_sync_rows_reorders_and_keeps_cursor_on_key():
+    def check(table):
+        table.sync_rows(rows("abcde"))
+        table.move_cursor(row=1)  # "b"
+        table.sync_rows(rows("edcba"))
+        assert displayed(table) == list("edcba")
+        assert table.cursor_key() == "b"
+        assert table.get_row("e") == ["E", 1]
+
+    with_table(check)
+
+
+def test_sync_rows_updates_cells_and_drops_missing_keys():
+    def check(table):
+        table.sync_rows(rows("abc"))
+        table.sync_rows(rows("cb", size=2) + rows("d"))
+        assert displayed(table) == ["c", "b", "d"]
+        assert table.get_row("c") == ["C", 2]
+        assert table.get_row("d") == ["D", 1]
+
+    with_table(check)